@@ -13,18 +13,34 @@ Example:
 """
 
 import argparse
+import asyncio
+import csv
+import itertools
 import json
 import os
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
-import re
+from typing import Callable, Dict, List, Optional
 
 # Add project root to path
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
+from storage import ResponseCache, dump_json, dumps_line, link_latest, load_json, loads
+
+# Optional at import time so the module can be loaded without API extras;
+# the analyzer reports a missing package when it is constructed
+try:
+    import anthropic
+except ImportError:
+    anthropic = None
+
+try:
+    from dotenv import load_dotenv
+except ImportError:
+    load_dotenv = None
+
 
 class BilateralImpactAnalyzer:
     """Analyzes bilateral relationship impacts from UN voting results"""
@@ -39,18 +55,73 @@ class BilateralImpactAnalyzer:
         "strained_moderately",         # Noticeable tension
         "strained_significantly"       # Major deterioration
     ]
+    _CATEGORY_SET = frozenset(IMPACT_CATEGORIES)
+
+    IMPACT_EMOJI = {
+        "strengthened_significantly": "💚",
+        "strengthened_moderately": "🟢",
+        "strengthened_slightly": "🟡",
+        "neutral": "⚪",
+        "strained_slightly": "🟠",
+        "strained_moderately": "🔴",
+        "strained_significantly": "🔥"
+    }
+
+    SYSTEM_PROMPT = """You are an expert international relations analyst specializing in Middle East diplomacy and bilateral relationships.
+
+Your task is to analyze how a country's vote on a UN resolution affects its bilateral relationship with Israel. Consider:
+- Historical relationship baseline
+- Vote alignment or divergence
+- Diplomatic tone in statement
+- Strategic implications
+- Regional dynamics
+- Economic/security ties
+
+Be objective and nuanced. Not all "yes" votes strengthen relations equally, and not all "no" votes strain them equally."""
+
+    # Forced tool call used to get schema-shaped analyses back from the model
+    RECORD_IMPACT_TOOL = {
+        "name": "record_impact",
+        "description": "Record the bilateral impact assessment for the country.",
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "impact_category": {"type": "string", "enum": IMPACT_CATEGORIES},
+                "reasoning": {"type": "string"},
+                "confidence": {"type": "string", "enum": ["high", "medium", "low"]},
+                "key_factors": {"type": "array", "items": {"type": "string"}}
+            },
+            "required": ["impact_category", "reasoning", "confidence", "key_factors"]
+        }
+    }
+
+    # Seconds between Message Batch status checks
+    BATCH_POLL_INTERVAL = 30
+
+    # Default number of in-flight API requests (keep under the account's RPM limit)
+    DEFAULT_CONCURRENCY = 20
+
+    # Default number of countries analyzed per API request
+    DEFAULT_GROUP_SIZE = 15
+
+    # Output token budget per analyzed country (a record_impact call is ~150-200
+    # tokens), and the model's hard ceiling
+    MAX_TOKENS_PER_COUNTRY = 300
+    MAX_OUTPUT_TOKENS = 8192
 
-    def __init__(self, model: str = "claude-3-5-haiku-20241022"):
+    def __init__(self, model: str = "claude-3-5-haiku-20241022", use_cache: bool = True):
         """
         Initialize the analyzer with a fast model for efficiency
 
         Args:
             model: Model name (default: claude-3-5-haiku for speed)
+            use_cache: Reuse previously cached analyses for identical prompts
         """
         self.model = model
         self.project_root = PROJECT_ROOT
         self.reactions_dir = self.project_root / "tasks" / "reactions"
         self.results_dir = self.project_root / "tasks" / "analysis"
+        self.cache = ResponseCache(self.project_root / ".cache" / "bilateral") if use_cache else None
 
         # Load configuration
         self._load_config()
@@ -58,7 +129,9 @@ class BilateralImpactAnalyzer:
 
     def _load_config(self):
         """Load configuration from environment variables"""
-        from dotenv import load_dotenv
+        if load_dotenv is None:
+            print("Error: python-dotenv package not installed. Run: pip install python-dotenv")
+            sys.exit(1)
         load_dotenv()
 
         self.anthropic_api_key = os.getenv("ANTHROPIC_API_KEY")
@@ -67,14 +140,13 @@ class BilateralImpactAnalyzer:
 
     def _init_ai_client(self):
         """Initialize Anthropic AI client"""
-        try:
-            import anthropic
-            self.client = anthropic.Anthropic(api_key=self.anthropic_api_key)
-            print(f"✓ Initialized Anthropic API client (model: {self.model})")
-        except ImportError:
+        if anthropic is None:
             print("Error: anthropic package not installed. Run: pip install anthropic")
             sys.exit(1)
 
+        self.aclient = anthropic.AsyncAnthropic(api_key=self.anthropic_api_key)
+        print(f"✓ Initialized Anthropic API client (model: {self.model})")
+
     def load_voting_results(self, motion_id: str) -> Dict:
         """Load the latest voting results for a motion"""
         results_file = self.reactions_dir / f"{motion_id}_latest.json"
@@ -85,48 +157,85 @@ class BilateralImpactAnalyzer:
                 f"Run the motion simulation first."
             )
 
-        with open(results_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return load_json(results_file)
 
-    def analyze_bilateral_impact(self, country_vote: Dict, motion_context: str) -> Dict:
+    def _build_prompt(self, country_vote: Dict, motion_context: str) -> Dict:
         """
-        Analyze how a country's vote affects its bilateral relationship with Israel
+        Build the Messages API parameters for one country's bilateral analysis
 
         Args:
             country_vote: Dict with country name, vote, and statement
             motion_context: Context about the motion being voted on
 
         Returns:
-            Dict with impact category, reasoning, and confidence
+            Dict of keyword arguments for messages.create / a batch request
         """
 
-        system_prompt = """You are an expert international relations analyst specializing in Middle East diplomacy and bilateral relationships.
-
-Your task is to analyze how a country's vote on a UN resolution affects its bilateral relationship with Israel. Consider:
-- Historical relationship baseline
-- Vote alignment or divergence
-- Diplomatic tone in statement
-- Strategic implications
-- Regional dynamics
-- Economic/security ties
+        # Everything that is identical across countries goes first so the
+        # prefix (system + shared instructions) can be served from the cache
+        shared_prompt = f"""Analyze how a country's vote affects its bilateral relationship with Israel.
 
-Be objective and nuanced. Not all "yes" votes strengthen relations equally, and not all "no" votes strain them equally."""
+**Motion Context:** {motion_context}
 
-        user_prompt = f"""Analyze how this country's vote affects its bilateral relationship with Israel:
+Record your assessment with the record_impact tool:
+1. "impact_category": The change in the bilateral relationship
+2. "reasoning": 2-3 sentences explaining your assessment
+3. "confidence": Your confidence level (high/medium/low)
+4. "key_factors": 2-4 key factors driving this assessment
 
-**Motion Context:** {motion_context}
+Consider:
+- Does this vote strengthen or strain the relationship compared to baseline?
+- How significant is the impact (slightly/moderately/significantly)?
+- What does the statement's tone reveal about the relationship?
+- Are there strategic, economic, or security dimensions?"""
 
-**Country:** {country_vote['country']}
+        country_prompt = f"""**Country:** {country_vote['country']}
 **Vote:** {country_vote['vote'].upper()}
 **Statement:** {country_vote['statement']}
 
-Based on this vote and statement, categorize the impact on Israel-{country_vote['country']} bilateral relations.
+Based on this vote and statement, categorize the impact on Israel-{country_vote['country']} bilateral relations."""
 
-You must respond with a JSON object containing:
-1. "impact_category": Must be exactly one of: {', '.join(self.IMPACT_CATEGORIES)}
-2. "reasoning": 2-3 sentences explaining your assessment
-3. "confidence": Your confidence level (high/medium/low)
-4. "key_factors": Array of 2-4 key factors driving this assessment
+        return {
+            "model": self.model,
+            "max_tokens": self.MAX_TOKENS_PER_COUNTRY,
+            "system": [
+                {"type": "text", "text": self.SYSTEM_PROMPT, "cache_control": {"type": "ephemeral"}}
+            ],
+            "messages": [
+                {
+                    "role": "user",
+                    "content": [
+                        {"type": "text", "text": shared_prompt, "cache_control": {"type": "ephemeral"}},
+                        {"type": "text", "text": country_prompt}
+                    ]
+                }
+            ],
+            "tools": [self.RECORD_IMPACT_TOOL],
+            "tool_choice": {"type": "tool", "name": self.RECORD_IMPACT_TOOL["name"]},
+            "temperature": 0.5
+        }
+
+    def _build_group_prompt(self, votes_chunk: List[Dict], motion_context: str) -> Dict:
+        """
+        Build the Messages API parameters for analyzing several countries at once
+
+        Args:
+            votes_chunk: Country votes to analyze in a single request
+            motion_context: Context about the motion being voted on
+
+        Returns:
+            Dict of keyword arguments for messages.create
+        """
+        shared_prompt = f"""Analyze how each of the following countries' votes affects its bilateral relationship with Israel.
+
+**Motion Context:** {motion_context}
+
+Record your assessments with the record_impacts tool, one entry per country in the same order as the numbered list:
+1. "country": The country name exactly as given
+2. "impact_category": The change in the bilateral relationship
+3. "reasoning": 2-3 sentences explaining your assessment
+4. "confidence": Your confidence level (high/medium/low)
+5. "key_factors": 2-4 key factors driving this assessment
 
 Consider:
 - Does this vote strengthen or strain the relationship compared to baseline?
@@ -134,90 +243,331 @@ Consider:
 - What does the statement's tone reveal about the relationship?
 - Are there strategic, economic, or security dimensions?
 
-Your response must be valid JSON in this exact format:
-{{
-  "impact_category": "neutral",
-  "reasoning": "Your analysis here.",
-  "confidence": "high",
-  "key_factors": ["factor 1", "factor 2", "factor 3"]
-}}"""
+Assess each country independently."""
+
+        countries_prompt = "\n\n".join(
+            f"""{i}. **Country:** {vote['country']}
+   **Vote:** {vote['vote'].upper()}
+   **Statement:** {vote['statement']}"""
+            for i, vote in enumerate(votes_chunk, 1)
+        )
+        countries_prompt += f"\n\nRecord exactly {len(votes_chunk)} analyses."
+
+        group_tool = {
+            "name": "record_impacts",
+            "description": "Record the bilateral impact assessment for every listed country.",
+            "input_schema": {
+                "type": "object",
+                "properties": {
+                    "analyses": {
+                        "type": "array",
+                        "minItems": len(votes_chunk),
+                        "maxItems": len(votes_chunk),
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "country": {"type": "string"},
+                                **self.RECORD_IMPACT_TOOL["input_schema"]["properties"]
+                            },
+                            "required": ["country", *self.RECORD_IMPACT_TOOL["input_schema"]["required"]]
+                        }
+                    }
+                },
+                "required": ["analyses"]
+            }
+        }
 
-        try:
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=600,
-                system=system_prompt,
-                messages=[
-                    {"role": "user", "content": user_prompt}
-                ],
-                temperature=0.5
-            )
-            content = response.content[0].text.strip()
-
-            # Extract JSON from response (handle markdown code blocks and extra text)
-            if content.startswith("```"):
-                content = re.sub(r'^```(?:json)?\n', '', content)
-                content = re.sub(r'\n```$', '', content)
-
-            # Find JSON object boundaries
-            start_idx = content.find('{')
-            if start_idx == -1:
-                raise ValueError("No JSON object found in response")
-
-            # Find matching closing brace
-            brace_count = 0
-            end_idx = start_idx
-            for i in range(start_idx, len(content)):
-                if content[i] == '{':
-                    brace_count += 1
-                elif content[i] == '}':
-                    brace_count -= 1
-                    if brace_count == 0:
-                        end_idx = i + 1
-                        break
-
-            json_str = content[start_idx:end_idx]
-
-            # Parse JSON response
-            result = json.loads(json_str)
-
-            # Validate response
-            required_fields = ["impact_category", "reasoning", "confidence", "key_factors"]
-            for field in required_fields:
-                if field not in result:
-                    raise ValueError(f"Response missing required field: {field}")
-
-            if result["impact_category"] not in self.IMPACT_CATEGORIES:
-                raise ValueError(f"Invalid impact category: {result['impact_category']}")
-
-            return result
-
-        except json.JSONDecodeError as e:
-            print(f"  ⚠ JSON parse error for {country_vote['country']}: {e}")
+        return {
+            "model": self.model,
+            "max_tokens": min(self.MAX_TOKENS_PER_COUNTRY * len(votes_chunk), self.MAX_OUTPUT_TOKENS),
+            "system": [
+                {"type": "text", "text": self.SYSTEM_PROMPT, "cache_control": {"type": "ephemeral"}}
+            ],
+            "messages": [
+                {
+                    "role": "user",
+                    "content": [
+                        {"type": "text", "text": shared_prompt, "cache_control": {"type": "ephemeral"}},
+                        {"type": "text", "text": countries_prompt}
+                    ]
+                }
+            ],
+            "tools": [group_tool],
+            "tool_choice": {"type": "tool", "name": group_tool["name"]},
+            "temperature": 0.5
+        }
+
+    def _tool_input(self, message) -> Dict:
+        """Return the arguments of the forced tool call in a Messages API response"""
+        if message.stop_reason == "max_tokens":
+            # The tool arguments were cut off mid-generation
+            raise ValueError("Response truncated at max_tokens")
+
+        for block in message.content:
+            if block.type == "tool_use":
+                result = block.input
+                break
+        else:
+            raise ValueError(f"No tool call in response (stop_reason: {message.stop_reason})")
+
+        # The tally in run_analysis is keyed by category
+        for analysis in result.get("analyses", [result]):
+            if analysis.get("impact_category") not in self._CATEGORY_SET:
+                raise ValueError(f"Invalid impact category: {analysis.get('impact_category')}")
+
+        return result
+
+    @staticmethod
+    def _fast_classify(vote: Dict) -> Optional[Dict]:
+        """
+        Rule-based triage for votes that need no model judgment
+
+        Returns:
+            An impact analysis for trivially categorizable votes, or None if the
+            vote should be escalated to the model
+        """
+        statement = (vote.get('statement') or '').strip()
+
+        # The simulation could not get a real vote/statement from this agent
+        if vote.get('error') or not statement or statement.startswith('[Error'):
             return {
                 "impact_category": "neutral",
-                "reasoning": "[Error: Unable to parse response]",
+                "reasoning": "No substantive statement was recorded for this vote, so no change in the bilateral relationship can be inferred.",
                 "confidence": "low",
-                "key_factors": ["analysis_error"],
-                "error": str(e)
+                "key_factors": ["no_statement", "rule_based_triage"]
             }
-        except Exception as e:
-            print(f"  ⚠ Error analyzing {country_vote['country']}: {e}")
+
+        # A brief abstention without an explanation signals no shift either way
+        if vote['vote'] == 'abstain' and len(statement) < 100:
             return {
                 "impact_category": "neutral",
-                "reasoning": f"[Error: {str(e)}]",
-                "confidence": "low",
-                "key_factors": ["analysis_error"],
-                "error": str(e)
+                "reasoning": "The country abstained with only a brief statement, indicating no meaningful change in bilateral relations.",
+                "confidence": "medium",
+                "key_factors": ["brief_abstention", "rule_based_triage"]
             }
 
-    def run_analysis(self, motion_id: str, sample_size: Optional[int] = None) -> Dict:
+        return None
+
+    @staticmethod
+    def _error_result(reasoning: str, error: str) -> Dict:
+        """Placeholder analysis recorded when a country could not be analyzed"""
+        return {
+            "impact_category": "neutral",
+            "reasoning": reasoning,
+            "confidence": "low",
+            "key_factors": ["analysis_error"],
+            "error": error
+        }
+
+    def _cache_result(self, request: Dict, impact_analysis: Dict):
+        """Cache an analysis under the single-country request that produced it"""
+        if self.cache is not None and "error" not in impact_analysis:
+            self.cache.put(ResponseCache.make_key(request), impact_analysis)
+
+    async def analyze_bilateral_impact(self, country_vote: Dict, motion_context: str) -> Dict:
+        """
+        Analyze how a country's vote affects its bilateral relationship with Israel
+
+        Args:
+            country_vote: Dict with country name, vote, and statement
+            motion_context: Context about the motion being voted on
+
+        Returns:
+            Dict with impact category, reasoning, and confidence
+        """
+        try:
+            request = self._build_prompt(country_vote, motion_context)
+            response = await self.aclient.messages.create(**request)
+            impact_analysis = self._tool_input(response)
+            self._cache_result(request, impact_analysis)
+            return impact_analysis
+
+        except Exception as e:
+            print(f"  ⚠ Error analyzing {country_vote['country']}: {e}")
+            return self._error_result(f"[Error: {str(e)}]", str(e))
+
+    async def analyze_bilateral_impact_batch(self, votes_chunk: List[Dict],
+                                             motion_context: str) -> List[Dict]:
+        """
+        Analyze several countries' bilateral impacts in a single request
+
+        Analyses are matched to votes by country name. Falls back to one request
+        per country if the grouped response cannot be parsed or does not contain
+        exactly one analysis for each requested country. Grouped analyses are
+        not cached, since they did not come from the single-country prompt.
+
+        Args:
+            votes_chunk: Country votes to analyze together
+            motion_context: Context about the motion being voted on
+
+        Returns:
+            List of impact analyses, in the same order as votes_chunk
+        """
+        if len(votes_chunk) == 1:
+            return [await self.analyze_bilateral_impact(votes_chunk[0], motion_context)]
+
+        try:
+            response = await self.aclient.messages.create(
+                **self._build_group_prompt(votes_chunk, motion_context)
+            )
+            analyses = self._tool_input(response)["analyses"]
+            if len(analyses) != len(votes_chunk):
+                raise ValueError(f"Expected {len(votes_chunk)} analyses, got {len(analyses)}")
+            by_country = {analysis.pop("country", None): analysis for analysis in analyses}
+            expected = [vote['country'] for vote in votes_chunk]
+            if set(by_country) != set(expected):
+                raise ValueError(f"Analyses do not match requested countries: {sorted(map(str, by_country))}")
+            return [by_country[country] for country in expected]
+
+        except Exception as e:
+            countries = ", ".join(vote['country'] for vote in votes_chunk)
+            print(f"  ⚠ Grouped analysis failed ({e}); retrying individually: {countries}")
+            return [
+                await self.analyze_bilateral_impact(vote, motion_context)
+                for vote in votes_chunk
+            ]
+
+    async def _run_batch(self, votes: List[Dict], motion_context: str,
+                         on_complete: Callable[[Dict, Dict], None]):
+        """
+        Submit all country prompts as one Message Batch and wait for it to finish
+
+        Args:
+            votes: Country votes to analyze (Israel already excluded)
+            motion_context: Context about the motion being voted on
+            on_complete: Called with (vote, impact_analysis) for every country
+        """
+        requests = {vote['country_slug']: self._build_prompt(vote, motion_context) for vote in votes}
+
+        batch = await self.aclient.messages.batches.create(requests=[
+            {"custom_id": slug, "params": params}
+            for slug, params in requests.items()
+        ])
+        print(f"✓ Submitted batch {batch.id} ({len(requests)} requests)")
+
+        while batch.processing_status != "ended":
+            await asyncio.sleep(self.BATCH_POLL_INTERVAL)
+            batch = await self.aclient.messages.batches.retrieve(batch.id)
+            counts = batch.request_counts
+            done = counts.succeeded + counts.errored + counts.canceled + counts.expired
+            print(f"  ... {done}/{len(requests)} requests processed")
+
+        impacts = {}
+        async for entry in await self.aclient.messages.batches.results(batch.id):
+            if entry.result.type != "succeeded":
+                impacts[entry.custom_id] = self._error_result(
+                    f"[Error: batch request {entry.result.type}]",
+                    entry.result.type
+                )
+                continue
+
+            try:
+                impacts[entry.custom_id] = self._tool_input(entry.result.message)
+                self._cache_result(requests[entry.custom_id], impacts[entry.custom_id])
+            except Exception as e:
+                print(f"  ⚠ Error analyzing {entry.custom_id}: {e}")
+                impacts[entry.custom_id] = self._error_result(f"[Error: {str(e)}]", str(e))
+
+        print()
+        for vote in votes:
+            on_complete(vote, impacts.get(vote['country_slug']) or self._error_result(
+                "[Error: No batch result returned]", "missing_result"
+            ))
+
+    async def _run_concurrent(self, votes: List[Dict], motion_context: str,
+                              concurrency: int, group_size: int,
+                              on_complete: Callable[[Dict, Dict], None]):
+        """
+        Analyze all countries concurrently, bounded by a semaphore
+
+        Args:
+            votes: Country votes to analyze (Israel already excluded)
+            motion_context: Context about the motion being voted on
+            concurrency: Maximum number of in-flight API requests
+            group_size: Number of countries analyzed per request
+            on_complete: Called with (vote, impact_analysis) as each country finishes
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def analyze(votes_chunk: List[Dict]):
+            async with semaphore:
+                chunk_analyses = await self.analyze_bilateral_impact_batch(
+                    votes_chunk, motion_context
+                )
+
+            for vote, impact_analysis in zip(votes_chunk, chunk_analyses):
+                on_complete(vote, impact_analysis)
+
+        chunks = [list(chunk) for chunk in itertools.batched(votes, group_size)]
+        outcomes = await asyncio.gather(
+            *(analyze(chunk) for chunk in chunks),
+            return_exceptions=True
+        )
+
+        for votes_chunk, outcome in zip(chunks, outcomes):
+            if isinstance(outcome, BaseException):
+                print(f"  ⚠ Error analyzing {', '.join(vote['country'] for vote in votes_chunk)}: {outcome}")
+                for vote in votes_chunk:
+                    on_complete(vote, self._error_result(f"[Error: {str(outcome)}]", str(outcome)))
+
+    def _checkpoint_path(self, motion_id: str) -> Path:
+        """Path of the append-only JSONL file holding analyses completed so far"""
+        return self.results_dir / f"{motion_id}_israel_bilateral_impact_analyses.jsonl"
+
+    @staticmethod
+    def _load_checkpoint(checkpoint_path: Path) -> Dict[str, Dict]:
+        """
+        Read completed analyses from a checkpoint file, keyed by country
+
+        Analyses that failed are left out, so a resumed run retries them.
+        """
+        completed = {}
+        if not checkpoint_path.exists():
+            return completed
+
+        with open(checkpoint_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = loads(line)
+                except json.JSONDecodeError:
+                    # Last line was cut off by an interruption
+                    continue
+                if "error" not in entry['impact_analysis']:
+                    completed[entry['country']] = entry
+        return completed
+
+    def _checkpoint_matches(self, entry: Dict, vote: Dict) -> bool:
+        """Whether a checkpointed analysis was made by this model for this exact vote"""
+        return (
+            entry.get('model') == self.model
+            and entry['vote'] == vote['vote']
+            and entry['statement'] == vote['statement']
+        )
+
+    async def run_analysis(self, motion_id: str, sample_size: Optional[int] = None,
+                           concurrency: int = DEFAULT_CONCURRENCY,
+                           group_size: int = DEFAULT_GROUP_SIZE,
+                           use_batch_api: bool = False,
+                           triage: bool = True,
+                           fresh: bool = False) -> Dict:
         """
         Run bilateral impact analysis for all countries
 
+        Every completed analysis is appended to a JSONL checkpoint as soon as it
+        finishes; if a previous run was interrupted, countries already analyzed
+        in the checkpoint are skipped and those that failed are retried.
+        Checkpointed analyses made by another model, or of a vote or statement
+        that has since changed, are analyzed again.
+
         Args:
             motion_id: ID of the motion to analyze
             sample_size: If set, only analyze this many countries (for testing)
+            concurrency: Maximum number of in-flight API requests
+            group_size: Number of countries analyzed per request (1 disables grouping)
+            use_batch_api: Submit all countries as one Message Batch instead of
+                concurrent requests (cheaper, but can take much longer to finish)
+            triage: Categorize trivial votes with rules instead of the model
+            fresh: Discard any checkpoint from an earlier run instead of resuming
 
         Returns:
             Dict containing all analyses and summary statistics
@@ -243,41 +593,81 @@ Your response must be valid JSON in this exact format:
         else:
             print(f"📊 Analyzing {len(votes)} countries\n")
 
-        # Analyze each country's impact
-        analyses = []
-        impact_counts = {cat: 0 for cat in self.IMPACT_CATEGORIES}
-
-        for i, vote in enumerate(votes, 1):
-            # Skip Israel itself
-            if vote['country'].lower() == 'israel':
-                print(f"[{i}/{len(votes)}] Skipping Israel (self)...")
-                continue
-
-            print(f"[{i}/{len(votes)}] Analyzing {vote['country']}...", end=" ", flush=True)
-
-            impact_analysis = self.analyze_bilateral_impact(vote, motion_context)
-
-            impact_counts[impact_analysis["impact_category"]] += 1
+        # Skip Israel itself
+        votes = [vote for vote in votes if vote['country'].lower() != 'israel']
 
-            analyses.append({
-                "country": vote['country'],
-                "vote": vote['vote'],
-                "statement": vote['statement'],
-                "impact_analysis": impact_analysis
-            })
-
-            # Print impact result with emoji
-            impact_emoji = {
-                "strengthened_significantly": "💚",
-                "strengthened_moderately": "🟢",
-                "strengthened_slightly": "🟡",
-                "neutral": "⚪",
-                "strained_slightly": "🟠",
-                "strained_moderately": "🔴",
-                "strained_significantly": "🔥"
-            }
-            emoji = impact_emoji.get(impact_analysis["impact_category"], "❓")
-            print(f"{emoji} {impact_analysis['impact_category']}")
+        # Resume from an interrupted run
+        self.results_dir.mkdir(parents=True, exist_ok=True)
+        checkpoint_path = self._checkpoint_path(motion_id)
+        if fresh:
+            checkpoint_path.unlink(missing_ok=True)
+        checkpointed = self._load_checkpoint(checkpoint_path)
+        completed = {
+            vote['country']: checkpointed[vote['country']]
+            for vote in votes
+            if vote['country'] in checkpointed
+            and self._checkpoint_matches(checkpointed[vote['country']], vote)
+        }
+        stale = sum(1 for vote in votes if vote['country'] in checkpointed) - len(completed)
+        if stale:
+            print(f"⚠ Ignoring {stale} checkpointed analyses from a different model or vote\n")
+        remaining = [vote for vote in votes if vote['country'] not in completed]
+        if len(remaining) < len(votes):
+            print(f"↻ Resuming: {len(votes) - len(remaining)} countries already analyzed\n")
+
+        with open(checkpoint_path, 'a', encoding='utf-8') as checkpoint:
+
+            def record(vote: Dict, impact_analysis: Dict):
+                entry = {
+                    "country": vote['country'],
+                    "vote": vote['vote'],
+                    "statement": vote['statement'],
+                    "model": self.model,
+                    "impact_analysis": impact_analysis
+                }
+                checkpoint.write(dumps_line(entry) + "\n")
+                checkpoint.flush()
+                completed[vote['country']] = entry
+
+                # Print impact result with emoji
+                emoji = self.IMPACT_EMOJI.get(impact_analysis["impact_category"], "❓")
+                print(f"[{len(completed)}/{len(votes)}] {vote['country']}: {emoji} {impact_analysis['impact_category']}")
+
+            # Triage trivially categorizable votes; only the rest go to the model
+            escalated = []
+            for vote in remaining:
+                impact_analysis = self._fast_classify(vote) if triage else None
+                if impact_analysis is None:
+                    escalated.append(vote)
+                else:
+                    record(vote, impact_analysis)
+            if triage:
+                print(f"⚡ Triaged {len(remaining) - len(escalated)} countries without the model\n")
+
+            # Reuse analyses of identical prompts from earlier runs (new ones are
+            # cached as their single-country requests complete)
+            pending = escalated
+            if self.cache is not None:
+                pending = []
+                for vote in escalated:
+                    cached = self.cache.get(ResponseCache.make_key(self._build_prompt(vote, motion_context)))
+                    if cached is None:
+                        pending.append(vote)
+                    else:
+                        record(vote, cached)
+                print(f"💾 Reused {len(escalated) - len(pending)} cached analyses\n")
+
+            # Analyze each remaining country's impact
+            if use_batch_api:
+                await self._run_batch(pending, motion_context, record)
+            else:
+                await self._run_concurrent(pending, motion_context, concurrency, group_size, record)
+
+        # completed now holds both resumed and fresh analyses (failures included)
+        analyses = [completed[vote['country']] for vote in votes if vote['country'] in completed]
+        impact_counts = {cat: 0 for cat in self.IMPACT_CATEGORIES}
+        for analysis in analyses:
+            impact_counts[analysis['impact_analysis']["impact_category"]] += 1
 
         # Compile results
         results = {
@@ -289,7 +679,12 @@ Your response must be valid JSON in this exact format:
             "analyses": analyses,
             "metadata": {
                 "voting_summary": voting_results['vote_summary'],
-                "original_votes": voting_results['total_votes']
+                "original_votes": voting_results['total_votes'],
+                "triage": {
+                    "rule_based": len(remaining) - len(escalated),
+                    "escalated": len(escalated),
+                    "hit_ratio": round((len(remaining) - len(escalated)) / len(remaining), 3) if remaining else 0.0
+                }
             }
         }
 
@@ -316,25 +711,24 @@ Your response must be valid JSON in this exact format:
         filepath = self.results_dir / filename
 
         # Save results
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(results, f, indent=2, ensure_ascii=False)
+        dump_json(results, filepath)
 
         print(f"✓ Results saved to: {filepath}")
 
-        # Also create/update a "latest" version
+        # Also point the "latest" version at it
         latest_filepath = self.results_dir / f"{results['motion_id']}_israel_bilateral_impact_latest.json"
-        with open(latest_filepath, 'w', encoding='utf-8') as f:
-            json.dump(results, f, indent=2, ensure_ascii=False)
+        link_latest(filepath, latest_filepath)
 
         print(f"✓ Latest results: {latest_filepath}")
 
         # Generate CSV export for easy analysis
         self._export_csv(results, self.results_dir / f"{results['motion_id']}_israel_bilateral_impact.csv")
 
+        # The run is complete, so the resume checkpoint is no longer needed
+        self._checkpoint_path(results['motion_id']).unlink(missing_ok=True)
+
     def _export_csv(self, results: Dict, filepath: Path):
         """Export results to CSV format"""
-        import csv
-
         with open(filepath, 'w', newline='', encoding='utf-8') as f:
             writer = csv.writer(f)
 
@@ -349,16 +743,17 @@ Your response must be valid JSON in this exact format:
             ])
 
             # Data rows
-            for analysis in results['analyses']:
-                impact = analysis['impact_analysis']
-                writer.writerow([
+            writer.writerows([
+                (
                     analysis['country'],
                     analysis['vote'],
-                    impact['impact_category'],
-                    impact['confidence'],
-                    impact['reasoning'],
-                    '; '.join(impact['key_factors'])
-                ])
+                    analysis['impact_analysis']['impact_category'],
+                    analysis['impact_analysis']['confidence'],
+                    analysis['impact_analysis']['reasoning'],
+                    '; '.join(analysis['impact_analysis']['key_factors'])
+                )
+                for analysis in results['analyses']
+            ])
 
         print(f"✓ CSV export: {filepath}")
 
@@ -377,6 +772,12 @@ Examples:
 
   # Use different model
   python scripts/analyze_israel_bilateral_impact.py 01_gaza_ceasefire_resolution --model claude-3-5-sonnet-20241022
+
+  # Submit as a single Message Batch (~50% cheaper, slower to complete)
+  python scripts/analyze_israel_bilateral_impact.py 01_gaza_ceasefire_resolution --batch-api
+
+  # Start over instead of resuming an interrupted run
+  python scripts/analyze_israel_bilateral_impact.py 01_gaza_ceasefire_resolution --fresh
         """
     )
 
@@ -397,12 +798,58 @@ Examples:
         help="Model to use (default: claude-3-5-haiku for speed)"
     )
 
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=BilateralImpactAnalyzer.DEFAULT_CONCURRENCY,
+        help=f"Maximum concurrent API requests (default: {BilateralImpactAnalyzer.DEFAULT_CONCURRENCY})"
+    )
+
+    parser.add_argument(
+        "--group-size",
+        type=int,
+        default=BilateralImpactAnalyzer.DEFAULT_GROUP_SIZE,
+        help=f"Countries analyzed per API request (default: {BilateralImpactAnalyzer.DEFAULT_GROUP_SIZE}, 1 = one per request)"
+    )
+
+    parser.add_argument(
+        "--no-triage",
+        action="store_true",
+        help="Send every country to the model instead of categorizing trivial votes with rules"
+    )
+
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore cached analyses from previous runs and don't cache new ones"
+    )
+
+    parser.add_argument(
+        "--batch-api",
+        action="store_true",
+        help="Submit all countries as one Anthropic Message Batch instead of concurrent requests"
+    )
+
+    parser.add_argument(
+        "--fresh",
+        action="store_true",
+        help="Discard the checkpoint of an interrupted run instead of resuming from it"
+    )
+
     args = parser.parse_args()
 
     # Run analysis
     try:
-        analyzer = BilateralImpactAnalyzer(model=args.model)
-        results = analyzer.run_analysis(args.motion_id, sample_size=args.sample)
+        analyzer = BilateralImpactAnalyzer(model=args.model, use_cache=not args.no_cache)
+        results = asyncio.run(analyzer.run_analysis(
+            args.motion_id,
+            sample_size=args.sample,
+            concurrency=args.concurrency,
+            group_size=args.group_size,
+            use_batch_api=args.batch_api,
+            triage=not args.no_triage,
+            fresh=args.fresh
+        ))
         analyzer.save_results(results)
 
         print("\n✓ Bilateral impact analysis complete!")
@@ -412,6 +859,7 @@ Examples:
         sys.exit(1)
     except KeyboardInterrupt:
         print("\n\n⚠ Analysis interrupted by user")
+        print("💾 Completed analyses are checkpointed; re-run the same command to resume")
         sys.exit(130)
     except Exception as e:
         print(f"\n❌ Unexpected error: {e}", file=sys.stderr)
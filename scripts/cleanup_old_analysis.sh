@@ -19,6 +19,14 @@ BEFORE_COUNT=$(find "$ANALYSIS_DIR" -type f -name "*_202*.json" -o -name "*_202*
 echo "Found $BEFORE_COUNT timestamped files"
 echo
 
+# _latest.json files may be symlinks to a timestamped file; materialize them
+# first so they survive the cleanup below
+for latest in "$ANALYSIS_DIR"/*_latest.json; do
+    if [ -L "$latest" ]; then
+        cp --remove-destination "$(readlink -f "$latest")" "$latest"
+    fi
+done
+
 # Remove timestamped JSON files (keep _latest.json)
 echo "Removing timestamped JSON files..."
 find "$ANALYSIS_DIR" -type f -name "*_202*.json" ! -name "*_latest.json" -delete
@@ -3,32 +3,29 @@
 Generate agent directories and system prompts for each UN member state.
 """
 
-import json
-import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 
+from storage import load_json
+
+
+_SANITIZE_TABLE = str.maketrans({' ': '-', "'": '', '(': '', ')': ''})
+
 
 def sanitize_folder_name(name):
     """Convert country name to a valid folder name."""
-    # Replace spaces and special characters with hyphens
-    sanitized = name.lower()
-    sanitized = sanitized.replace(" ", "-")
-    sanitized = sanitized.replace("'", "")
-    sanitized = sanitized.replace("(", "")
-    sanitized = sanitized.replace(")", "")
-    return sanitized
+    # Replace spaces with hyphens and drop apostrophes and parentheses
+    return name.lower().translate(_SANITIZE_TABLE)
 
 
-def generate_system_prompt(country_name, country_code, is_p5=False):
-    """Generate a system prompt for a UN delegate agent."""
-
-    p5_text = ""
-    if is_p5:
-        p5_text = """
+_P5_BLOCK = """
 
 As a permanent member of the UN Security Council (P5), you hold veto power over substantive Security Council resolutions. This gives you significant influence in matters of international peace and security."""
 
-    prompt = f"""# UN Delegate Agent: {country_name}
+_EMPTY = ""
+
+_TEMPLATE = """# UN Delegate Agent: {country_name}
 
 ## Role and Identity
 
@@ -83,13 +80,47 @@ You will be presented with UN agenda items, proposed resolutions, and debate top
 Remember: You represent {country_name} and its people. Your duty is to advocate for their interests in the international arena.
 """
 
-    return prompt
+
+def generate_system_prompt(country_name, country_code, is_p5=False):
+    """Generate a system prompt for a UN delegate agent."""
+    return _TEMPLATE.format_map({
+        'country_name': country_name,
+        'country_code': country_code,
+        'p5_text': _P5_BLOCK if is_p5 else _EMPTY,
+    })
+
+
+def _write_country(country, agents_dir):
+    """
+    Create one country's agent directory and system prompt.
+
+    Returns (folder_name, written); the prompt file is left untouched when its
+    content is already current, so re-runs don't churn mtimes.
+    """
+    entity = country['Entity']
+    code = country['Code']
+    is_p5 = country.get('Security Council P5', 0) == 1
+
+    # Create sanitized folder name
+    folder_name = sanitize_folder_name(entity)
+    country_dir = agents_dir / folder_name
+    country_dir.mkdir(exist_ok=True)
+
+    # Generate and write system prompt
+    system_prompt = generate_system_prompt(entity, code, is_p5)
+    prompt_file = country_dir / 'system-prompt.md'
+
+    new_bytes = system_prompt.encode('utf-8')
+    if prompt_file.exists() and prompt_file.read_bytes() == new_bytes:
+        return folder_name, False
+
+    prompt_file.write_bytes(new_bytes)
+    return folder_name, True
 
 
 def main():
     # Load the UN membership data
-    with open('data/united-nations-membership-status.json', 'r') as f:
-        countries = json.load(f)
+    countries = load_json(Path('data/united-nations-membership-status.json'))
 
     # Create the agents directory
     agents_dir = Path('agents')
@@ -97,29 +128,23 @@ def main():
 
     print(f"Creating agent directories and system prompts...")
 
-    created_count = 0
+    # Writes are independent per country, so overlap their filesystem latency
+    with ThreadPoolExecutor(max_workers=32) as executor:
+        results = list(executor.map(partial(_write_country, agents_dir=agents_dir), countries))
 
-    for country in countries:
-        entity = country['Entity']
-        code = country['Code']
-        is_p5 = country.get('Security Council P5', 0) == 1
-
-        # Create sanitized folder name
-        folder_name = sanitize_folder_name(entity)
-        country_dir = agents_dir / folder_name
-        country_dir.mkdir(exist_ok=True)
-
-        # Generate and write system prompt
-        system_prompt = generate_system_prompt(entity, code, is_p5)
-        prompt_file = country_dir / 'system-prompt.md'
-
-        with open(prompt_file, 'w') as f:
-            f.write(system_prompt)
-
-        created_count += 1
-        print(f"  [{created_count:3d}] Created: {folder_name}")
+    created_count = 0
+    skipped_count = 0
+    for index, (folder_name, written) in enumerate(results, 1):
+        if written:
+            created_count += 1
+            print(f"  [{index:3d}] Created: {folder_name}")
+        else:
+            skipped_count += 1
+            print(f"  [{index:3d}] Unchanged: {folder_name}")
 
     print(f"\n✓ Successfully created {created_count} agent directories with system prompts")
+    if skipped_count:
+        print(f"  Skipped {skipped_count} unchanged prompt files")
     print(f"  Location: {agents_dir.absolute()}")
 
 
@@ -6,96 +6,87 @@ Synthesizes all voting data and bilateral impact analysis into a single
 comprehensive PDF report.
 
 Usage:
-    python scripts/generate_comprehensive_analysis.py <motion_id>
+    python scripts/generate_comprehensive_analysis.py <motion_id> [<motion_id> ...]
 
 Example:
     python scripts/generate_comprehensive_analysis.py 01_gaza_ceasefire_resolution
 """
 
 import argparse
-import json
+import importlib.util
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
+from functools import lru_cache
+from io import BytesIO
+from itertools import islice
 from pathlib import Path
 from typing import Dict, List
 
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
+from reporting import group_by_category
+from storage import load_json
+
+try:
+    from reportlab.lib import colors
+    from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.units import inch
+    from reportlab.platypus import (BaseDocTemplate, PageTemplate, Frame, Paragraph,
+                                     Spacer, LongTable, TableStyle, PageBreak, KeepTogether,
+                                     ListFlowable, ListItem, Image)
+    _HAS_REPORTLAB = True
+except ImportError:
+    _HAS_REPORTLAB = False
+
 
 def check_dependencies():
     """Check if required dependencies are installed"""
-    try:
-        from reportlab.lib.pagesizes import A4
-        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
-        from reportlab.lib.styles import getSampleStyleSheet
-        from reportlab.lib import colors
-        return True
-    except ImportError:
+    if not _HAS_REPORTLAB:
         print("Missing dependency: reportlab")
         print("\nInstall with: pip install reportlab")
-        return False
+    return _HAS_REPORTLAB
+
+
+def voting_results_path(motion_id: str) -> Path:
+    """Path of the latest voting results for a motion"""
+    return PROJECT_ROOT / "tasks" / "reactions" / f"{motion_id}_latest.json"
+
+
+def bilateral_impact_path(motion_id: str) -> Path:
+    """Path of the latest bilateral impact analysis for a motion"""
+    return PROJECT_ROOT / "tasks" / "analysis" / f"{motion_id}_israel_bilateral_impact_latest.json"
 
 
 def load_voting_results(motion_id: str) -> Dict:
     """Load voting results"""
-    reactions_dir = PROJECT_ROOT / "tasks" / "reactions"
-    results_file = reactions_dir / f"{motion_id}_latest.json"
+    results_file = voting_results_path(motion_id)
 
     if not results_file.exists():
         raise FileNotFoundError(f"Voting results not found: {results_file}")
 
-    with open(results_file, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    return load_json(results_file)
 
 
 def load_bilateral_impact(motion_id: str) -> Dict:
     """Load bilateral impact analysis"""
-    analysis_dir = PROJECT_ROOT / "tasks" / "analysis"
-    impact_file = analysis_dir / f"{motion_id}_israel_bilateral_impact_latest.json"
+    impact_file = bilateral_impact_path(motion_id)
 
     if not impact_file.exists():
         raise FileNotFoundError(f"Bilateral impact analysis not found: {impact_file}")
 
-    with open(impact_file, 'r', encoding='utf-8') as f:
-        return json.load(f)
-
-
-def generate_comprehensive_pdf(motion_id: str, output_pdf: Path = None):
-    """Generate comprehensive analysis PDF"""
-    from reportlab.lib.pagesizes import A4
-    from reportlab.platypus import (SimpleDocTemplate, Paragraph, Spacer, Table,
-                                     TableStyle, PageBreak, KeepTogether)
-    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-    from reportlab.lib.units import inch
-    from reportlab.lib import colors
-    from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY
-
-    # Load data
-    print("Loading data...")
-    voting_data = load_voting_results(motion_id)
-    bilateral_data = load_bilateral_impact(motion_id)
-
-    # Output path
-    if output_pdf is None:
-        analysis_dir = PROJECT_ROOT / "tasks" / "analysis" / "pdf"
-        analysis_dir.mkdir(parents=True, exist_ok=True)
-        output_pdf = analysis_dir / f"{motion_id}_comprehensive_analysis.pdf"
+    return load_json(impact_file)
 
-    # Create PDF
-    doc = SimpleDocTemplate(
-        str(output_pdf),
-        pagesize=A4,
-        rightMargin=72,
-        leftMargin=72,
-        topMargin=72,
-        bottomMargin=30,
-    )
 
-    elements = []
+@lru_cache(maxsize=1)
+def _build_styles():
+    """Build the report's paragraph styles once and reuse them across calls"""
     styles = getSampleStyleSheet()
 
-    # Custom styles
     styles.add(ParagraphStyle(
         name='CustomTitle',
         parent=styles['Heading1'],
@@ -105,12 +96,14 @@ def generate_comprehensive_pdf(motion_id: str, output_pdf: Path = None):
         alignment=TA_CENTER,
         fontName='Helvetica-Bold'
     ))
+    # Heading spaceAfter includes the gap before the section body, so no
+    # separate Spacer flowable is needed after each heading
     styles.add(ParagraphStyle(
         name='CustomHeading',
         parent=styles['Heading2'],
         fontSize=16,
         textColor=colors.HexColor('#2c5f8d'),
-        spaceAfter=12,
+        spaceAfter=12 + 0.2*inch,
         spaceBefore=12,
         fontName='Helvetica-Bold'
     ))
@@ -119,7 +112,7 @@ def generate_comprehensive_pdf(motion_id: str, output_pdf: Path = None):
         parent=styles['Heading3'],
         fontSize=12,
         textColor=colors.HexColor('#34495e'),
-        spaceAfter=6,
+        spaceAfter=6 + 0.1*inch,
         spaceBefore=6,
         fontName='Helvetica-Bold'
     ))
@@ -130,6 +123,150 @@ def generate_comprehensive_pdf(motion_id: str, output_pdf: Path = None):
         fontSize=10,
         leading=14
     ))
+    styles.add(ParagraphStyle(
+        name='Centered',
+        parent=styles['Normal'],
+        alignment=TA_CENTER,
+        fontSize=12
+    ))
+    styles.add(ParagraphStyle(
+        name='Footer',
+        parent=styles['Normal'],
+        fontSize=8,
+        textColor=colors.grey
+    ))
+
+    return styles
+
+
+# Summary table rows hold one line of text each, so their heights are known up
+# front: the default 12pt cell leading plus top/bottom padding (the header row
+# has extra bottom padding). Passing them explicitly skips ReportLab's row
+# auto-sizing.
+HEADER_ROW_HEIGHT = 12 + 3 + 12
+BODY_ROW_HEIGHT = 12 + 3 + 3
+
+
+def _row_heights(row_count: int) -> List[float]:
+    """Row heights for a summary table with a header row"""
+    return [HEADER_ROW_HEIGHT] + [BODY_ROW_HEIGHT] * (row_count - 1)
+
+
+# Paragraph text is parsed as XML-like markup, so every data-derived field is
+# escaped with this table before being combined with the report's own markup
+_XML_ESCAPES = str.maketrans({'<': '&lt;', '>': '&gt;', '&': '&amp;'})
+
+
+def _excerpt(text: str, limit: int) -> str:
+    """Shorten text to at most limit characters, cutting at a word boundary"""
+    if len(text) <= limit:
+        return text
+    cut = text.rfind(' ', 0, limit)
+    return text[:cut if cut > 0 else limit].rstrip() + '…'
+
+
+def _layout_mode(chart: bool) -> str:
+    """How the impact distribution will be laid out: "chart", or "table" without matplotlib"""
+    if chart and importlib.util.find_spec("matplotlib") is not None:
+        return "chart"
+    return "table"
+
+
+def _mode_stamp_path(output_file: Path) -> Path:
+    """Sidecar file recording the layout mode output_file was built with"""
+    return output_file.with_name(output_file.name + ".mode")
+
+
+def _is_up_to_date(output_file: Path, inputs: List[Path], mode: str) -> bool:
+    """True if output_file exists, was built in mode, and is newer than every input file"""
+    try:
+        if _mode_stamp_path(output_file).read_text(encoding='utf-8') != mode:
+            return False
+        output_mtime = output_file.stat().st_mtime_ns
+        return all(output_mtime > path.stat().st_mtime_ns for path in inputs)
+    except FileNotFoundError:
+        return False
+
+
+def _impact_chart(impact_summary: Dict[str, int]):
+    """
+    Render the impact distribution as a bar chart Image flowable
+
+    Returns None when matplotlib isn't installed, so the caller can fall back
+    to the table.
+    """
+    try:
+        import matplotlib
+        matplotlib.use('Agg')
+        import matplotlib.pyplot as plt
+    except ImportError:
+        return None
+
+    labels = [category.replace('_', ' ').title() for category in impact_summary]
+    counts = list(impact_summary.values())
+    bar_colors = ['#2e7d32' if category.startswith('strengthened') else
+                  '#c62828' if category.startswith('strained') else '#7f8c8d'
+                  for category in impact_summary]
+
+    fig, ax = plt.subplots(figsize=(5, 3))
+    try:
+        ax.barh(labels, counts, color=bar_colors)
+        ax.invert_yaxis()
+        ax.set_xlabel('Countries')
+        for y, count in enumerate(counts):
+            ax.text(count, y, f" {count}", va='center', fontsize=8)
+        ax.spines[['top', 'right']].set_visible(False)
+
+        buf = BytesIO()
+        fig.savefig(buf, format='png', dpi=150, bbox_inches='tight')
+    finally:
+        plt.close(fig)
+
+    buf.seek(0)
+    return Image(buf, width=5*inch, height=3*inch, kind='proportional')
+
+
+def generate_comprehensive_pdf(motion_id: str, output_pdf: Path = None, force: bool = False,
+                               chart: bool = True):
+    """
+    Generate comprehensive analysis PDF
+
+    The build is skipped when the PDF is already newer than both input files
+    and was built with the same impact layout (chart or table), unless force
+    is set. With chart=False (or without matplotlib) the impact
+    distribution is shown as a table.
+    """
+    # Output path
+    if output_pdf is None:
+        analysis_dir = PROJECT_ROOT / "tasks" / "analysis" / "pdf"
+        analysis_dir.mkdir(parents=True, exist_ok=True)
+        output_pdf = analysis_dir / f"{motion_id}_comprehensive_analysis.pdf"
+
+    inputs = [voting_results_path(motion_id), bilateral_impact_path(motion_id)]
+    if not force and _is_up_to_date(output_pdf, inputs, _layout_mode(chart)):
+        print(f"✓ Up-to-date: {output_pdf} (use --force to rebuild)")
+        return output_pdf
+
+    # Load data
+    print("Loading data...")
+    voting_data = load_voting_results(motion_id)
+    bilateral_data = load_bilateral_impact(motion_id)
+
+    # Create PDF: every page uses the same single frame, so skip
+    # SimpleDocTemplate's first/later page template handling
+    doc = BaseDocTemplate(
+        str(output_pdf),
+        pagesize=A4,
+        rightMargin=72,
+        leftMargin=72,
+        topMargin=72,
+        bottomMargin=30,
+    )
+    frame = Frame(doc.leftMargin, doc.bottomMargin, doc.width, doc.height, id='normal')
+    doc.addPageTemplates([PageTemplate(id='main', frames=[frame])])
+
+    elements = []
+    styles = _build_styles()
 
     # TITLE PAGE
     elements.append(Spacer(1, 1.5*inch))
@@ -139,12 +276,12 @@ def generate_comprehensive_pdf(motion_id: str, output_pdf: Path = None):
     ))
     elements.append(Spacer(1, 0.3*inch))
     elements.append(Paragraph(
-        f"Motion ID: {motion_id}",
-        ParagraphStyle('centered', parent=styles['Normal'], alignment=TA_CENTER, fontSize=12)
+        f"Motion ID: {motion_id.translate(_XML_ESCAPES)}",
+        styles['Centered']
     ))
     elements.append(Paragraph(
         f"Analysis Date: {datetime.now().strftime('%B %d, %Y')}",
-        ParagraphStyle('centered', parent=styles['Normal'], alignment=TA_CENTER, fontSize=12)
+        styles['Centered']
     ))
     elements.append(Spacer(1, 0.5*inch))
 
@@ -159,28 +296,33 @@ def generate_comprehensive_pdf(motion_id: str, output_pdf: Path = None):
 
     # SECTION 1: VOTING RESULTS
     elements.append(Paragraph("1. Voting Results Overview", styles['CustomHeading']))
-    elements.append(Spacer(1, 0.2*inch))
 
     vote_summary = voting_data['vote_summary']
     total_votes = voting_data['total_votes']
 
+    # Percentages are shared by the summary text and the table, so compute them once
+    vote_inv_total = 100.0 / total_votes if total_votes else 0.0
+    vote_pcts = {vote: count * vote_inv_total for vote, count in vote_summary.items()}
+
     vote_text = f"""The resolution received {vote_summary['yes']} votes in favor
-    ({vote_summary['yes']/total_votes*100:.1f}%), {vote_summary['no']} votes against
-    ({vote_summary['no']/total_votes*100:.1f}%), and {vote_summary['abstain']} abstentions
-    ({vote_summary['abstain']/total_votes*100:.1f}%)."""
+    ({vote_pcts['yes']:.1f}%), {vote_summary['no']} votes against
+    ({vote_pcts['no']:.1f}%), and {vote_summary['abstain']} abstentions
+    ({vote_pcts['abstain']:.1f}%)."""
     elements.append(Paragraph(vote_text, styles['Justified']))
     elements.append(Spacer(1, 0.2*inch))
 
     # Voting table
     vote_table_data = [
         ['Vote', 'Count', 'Percentage'],
-        ['YES', str(vote_summary['yes']), f"{vote_summary['yes']/total_votes*100:.1f}%"],
-        ['NO', str(vote_summary['no']), f"{vote_summary['no']/total_votes*100:.1f}%"],
-        ['ABSTAIN', str(vote_summary['abstain']), f"{vote_summary['abstain']/total_votes*100:.1f}%"],
+        ['YES', str(vote_summary['yes']), f"{vote_pcts['yes']:.1f}%"],
+        ['NO', str(vote_summary['no']), f"{vote_pcts['no']:.1f}%"],
+        ['ABSTAIN', str(vote_summary['abstain']), f"{vote_pcts['abstain']:.1f}%"],
         ['TOTAL', str(total_votes), '100.0%']
     ]
 
-    vote_table = Table(vote_table_data, colWidths=[2*inch, 1.5*inch, 1.5*inch])
+    vote_table = LongTable(vote_table_data, colWidths=[2*inch, 1.5*inch, 1.5*inch],
+                           rowHeights=_row_heights(len(vote_table_data)),
+                           splitByRow=1, repeatRows=1)
     vote_table.setStyle(TableStyle([
         ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1a5490')),
         ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
@@ -199,7 +341,6 @@ def generate_comprehensive_pdf(motion_id: str, output_pdf: Path = None):
     # SECTION 2: BILATERAL IMPACT ANALYSIS
     elements.append(PageBreak())
     elements.append(Paragraph("2. Israel Bilateral Relationship Impact", styles['CustomHeading']))
-    elements.append(Spacer(1, 0.2*inch))
 
     impact_summary = bilateral_data['impact_summary']
     total_analyzed = bilateral_data['total_analyzed']
@@ -211,32 +352,39 @@ def generate_comprehensive_pdf(motion_id: str, output_pdf: Path = None):
     elements.append(Paragraph(bilateral_text, styles['Justified']))
     elements.append(Spacer(1, 0.2*inch))
 
-    # Impact distribution table
-    impact_table_data = [['Impact Category', 'Countries', 'Percentage']]
-
-    for category, count in impact_summary.items():
-        pct = (count / total_analyzed * 100) if total_analyzed > 0 else 0
-        display_name = category.replace('_', ' ').title()
-        impact_table_data.append([display_name, str(count), f"{pct:.1f}%"])
-
-    impact_table = Table(impact_table_data, colWidths=[3*inch, 1.25*inch, 1.25*inch])
-    impact_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1a5490')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (0, -1), 'LEFT'),
-        ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 11),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('GRID', (0, 0), (-1, -1), 1, colors.grey),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f9f9f9')]),
-    ]))
-    elements.append(impact_table)
+    # Impact distribution: a pre-rendered chart is one image for ReportLab to
+    # place, instead of a table of individually stroked and filled cells
+    impact_inv_total = 100.0 / total_analyzed if total_analyzed else 0.0
+    impact_chart = _impact_chart(impact_summary) if chart else None
+
+    if impact_chart is not None:
+        elements.append(impact_chart)
+    else:
+        impact_table_data = [['Impact Category', 'Countries', 'Percentage']]
+
+        for category, count in impact_summary.items():
+            display_name = category.replace('_', ' ').title()
+            impact_table_data.append([display_name, str(count), f"{count * impact_inv_total:.1f}%"])
+
+        impact_table = LongTable(impact_table_data, colWidths=[3*inch, 1.25*inch, 1.25*inch],
+                                 rowHeights=_row_heights(len(impact_table_data)),
+                                 splitByRow=1, repeatRows=1)
+        impact_table.setStyle(TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1a5490')),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('ALIGN', (0, 0), (0, -1), 'LEFT'),
+            ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 11),
+            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+            ('GRID', (0, 0), (-1, -1), 1, colors.grey),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f9f9f9')]),
+        ]))
+        elements.append(impact_table)
     elements.append(Spacer(1, 0.3*inch))
 
     # SECTION 3: KEY FINDINGS
     elements.append(Paragraph("3. Key Findings", styles['CustomHeading']))
-    elements.append(Spacer(1, 0.2*inch))
 
     # Count strengthened vs strained
     strengthened = (impact_summary.get('strengthened_significantly', 0) +
@@ -248,30 +396,29 @@ def generate_comprehensive_pdf(motion_id: str, output_pdf: Path = None):
     neutral = impact_summary.get('neutral', 0)
 
     findings = [
-        f"• {strengthened} countries ({strengthened/total_analyzed*100:.1f}%) showed strengthened relations with Israel",
-        f"• {strained} countries ({strained/total_analyzed*100:.1f}%) experienced strained relations",
-        f"• {neutral} countries ({neutral/total_analyzed*100:.1f}%) maintained neutral bilateral status",
-        f"• The overwhelming vote in favor ({vote_summary['yes']} yes votes) indicates broad international support for humanitarian ceasefire",
+        f"{strengthened} countries ({strengthened * impact_inv_total:.1f}%) showed strengthened relations with Israel",
+        f"{strained} countries ({strained * impact_inv_total:.1f}%) experienced strained relations",
+        f"{neutral} countries ({neutral * impact_inv_total:.1f}%) maintained neutral bilateral status",
+        f"The overwhelming vote in favor ({vote_summary['yes']} yes votes) indicates broad international support for humanitarian ceasefire",
     ]
 
-    for finding in findings:
-        elements.append(Paragraph(finding, styles['Normal']))
-        elements.append(Spacer(1, 0.1*inch))
+    # One list flowable for all bullets rather than a Paragraph + Spacer each
+    elements.append(ListFlowable(
+        [ListItem(Paragraph(finding, styles['Normal']), spaceAfter=0.1*inch) for finding in findings],
+        bulletType='bullet',
+        start='•',
+        leftIndent=10,
+        bulletFontSize=10,
+    ))
 
     elements.append(Spacer(1, 0.2*inch))
 
     # SECTION 4: REGIONAL BREAKDOWN
     elements.append(PageBreak())
     elements.append(Paragraph("4. Notable Country Analyses", styles['CustomHeading']))
-    elements.append(Spacer(1, 0.2*inch))
 
     # Group by impact category - show top examples from each
-    by_category = {}
-    for analysis in bilateral_data['analyses']:
-        cat = analysis['impact_analysis']['impact_category']
-        if cat not in by_category:
-            by_category[cat] = []
-        by_category[cat].append(analysis)
+    by_category = group_by_category(bilateral_data['analyses'])
 
     # Show examples from key categories
     key_categories = [
@@ -281,32 +428,46 @@ def generate_comprehensive_pdf(motion_id: str, output_pdf: Path = None):
         ('strained_significantly', 'Relationships Significantly Strained'),
     ]
 
+    normal = styles['Normal']
+    justified = styles['Justified']
+    country_table_style = TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1a5490')),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+        ('ALIGN', (1, 0), (1, -1), 'CENTER'),
+        ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f9f9f9')]),
+    ])
+
     for cat_key, cat_title in key_categories:
         if cat_key in by_category and by_category[cat_key]:
             elements.append(Paragraph(cat_title, styles['CustomSubHeading']))
-            elements.append(Spacer(1, 0.1*inch))
-
-            # Show up to 5 examples
-            for analysis in by_category[cat_key][:5]:
-                country_text = f"<b>{analysis['country']}</b> (Voted: {analysis['vote'].upper()})"
-                elements.append(Paragraph(country_text, styles['Normal']))
 
-                reasoning = analysis['impact_analysis']['reasoning']
-                if len(reasoning) > 300:
-                    reasoning = reasoning[:300] + "..."
-                elements.append(Paragraph(reasoning, styles['Justified']))
-                elements.append(Spacer(1, 0.15*inch))
+            # Show up to 5 examples, as one splittable table per category
+            country_rows = [['Country', 'Vote', 'Reasoning']]
+            for analysis in islice(by_category[cat_key], 5):
+                reasoning = _excerpt(analysis['impact_analysis']['reasoning'], 300)
+                country_rows.append([
+                    Paragraph(f"<b>{analysis['country'].translate(_XML_ESCAPES)}</b>", normal),
+                    analysis['vote'].upper(),
+                    Paragraph(reasoning.translate(_XML_ESCAPES), justified),
+                ])
+
+            country_table = LongTable(country_rows, colWidths=[1.4*inch, 0.8*inch, 4.0*inch],
+                                      splitByRow=1, repeatRows=1)
+            country_table.setStyle(country_table_style)
+            elements.append(country_table)
 
             elements.append(Spacer(1, 0.2*inch))
 
     # Footer
     elements.append(PageBreak())
     elements.append(Paragraph("Methodology", styles['CustomHeading']))
-    elements.append(Spacer(1, 0.2*inch))
 
     methodology = f"""This analysis was generated using AI-powered diplomatic analysis.
     Voting data was collected from {voting_data['total_votes']} UN member states.
-    Bilateral impact assessments were conducted using {bilateral_data['model']}, analyzing
+    Bilateral impact assessments were conducted using {bilateral_data['model'].translate(_XML_ESCAPES)}, analyzing
     each country's vote, official statement, and historical relationship context with Israel.
 
     Impact categories range from 'strengthened significantly' to 'strained significantly' based on
@@ -317,12 +478,13 @@ def generate_comprehensive_pdf(motion_id: str, output_pdf: Path = None):
     elements.append(Spacer(1, 0.3*inch))
 
     footer_text = f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-    elements.append(Paragraph(footer_text, ParagraphStyle('footer', parent=styles['Normal'],
-                                                           fontSize=8, textColor=colors.grey)))
+    elements.append(Paragraph(footer_text, styles['Footer']))
 
     # Build PDF
     print(f"Generating comprehensive PDF: {output_pdf}")
     doc.build(elements)
+    _mode_stamp_path(output_pdf).write_text("chart" if impact_chart is not None else "table",
+                                            encoding='utf-8')
     print(f"✓ PDF generated successfully")
 
     return output_pdf
@@ -332,16 +494,28 @@ def main():
     parser = argparse.ArgumentParser(
         description="Generate comprehensive analysis PDF from voting and bilateral impact data"
     )
-    parser.add_argument("motion_id", help="Motion ID (e.g., 01_gaza_ceasefire_resolution)")
-    parser.add_argument("--output", type=Path, help="Output PDF path (optional)")
+    parser.add_argument("motion_ids", nargs='+', metavar="motion_id",
+                        help="Motion ID(s) (e.g., 01_gaza_ceasefire_resolution)")
+    parser.add_argument("--output", type=Path, help="Output PDF path (optional, single motion only)")
+    parser.add_argument("--force", action="store_true",
+                        help="Rebuild even if the PDF is newer than its input data")
+    parser.add_argument("--no-chart", action="store_true",
+                        help="Show the impact distribution as a table instead of a chart")
 
     args = parser.parse_args()
 
+    if args.output and len(args.motion_ids) > 1:
+        parser.error("--output can only be used with a single motion_id")
+
     if not check_dependencies():
         sys.exit(1)
 
+    if len(args.motion_ids) > 1:
+        sys.exit(_generate_parallel(args.motion_ids, args.force, not args.no_chart))
+
     try:
-        pdf_path = generate_comprehensive_pdf(args.motion_id, args.output)
+        pdf_path = generate_comprehensive_pdf(args.motion_ids[0], args.output, args.force,
+                                              not args.no_chart)
         print(f"\n✓ Comprehensive analysis PDF: {pdf_path}")
         print(f"  Size: {pdf_path.stat().st_size / 1024:.1f} KB")
     except FileNotFoundError as e:
@@ -354,5 +528,29 @@ def main():
         sys.exit(1)
 
 
+def _generate_parallel(motion_ids: List[str], force: bool = False, chart: bool = True) -> int:
+    """
+    Build one report per motion in worker processes
+
+    Rendering is CPU-bound and reports share no state, so this scales with
+    cores. Returns the process exit code (1 if any report failed).
+    """
+    exit_code = 0
+    workers = min(len(motion_ids), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(generate_comprehensive_pdf, motion_id, None, force, chart): motion_id
+                   for motion_id in motion_ids}
+        for future in as_completed(futures):
+            try:
+                pdf_path = future.result()
+            except Exception as e:
+                print(f"\n❌ Error ({futures[future]}): {e}")
+                exit_code = 1
+                continue
+            print(f"\n✓ Comprehensive analysis PDF: {pdf_path}")
+            print(f"  Size: {pdf_path.stat().st_size / 1024:.1f} KB")
+    return exit_code
+
+
 if __name__ == "__main__":
     main()
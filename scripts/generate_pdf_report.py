@@ -9,310 +9,448 @@ Supports multiple report types:
 - Custom markdown to PDF conversion
 
 Usage:
-    python scripts/generate_pdf_report.py <markdown_file> [--output output.pdf]
+    python scripts/generate_pdf_report.py <input_file> [<input_file> ...] [--output output.pdf]
 
 Example:
     python scripts/generate_pdf_report.py analysis/01_gaza_ceasefire_resolution_analysis_REVISED.md
 """
 
 import argparse
-import json
+import hashlib
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
+from functools import lru_cache
+from html import escape
 from pathlib import Path
-from typing import Optional
+from typing import Callable, List, Optional
 
 # Add project root to path
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
+from reporting import group_by_category
+from storage import load_json
 
-def check_dependencies():
-    """Check if required dependencies are installed"""
+# Rendered report bodies, reused while their source file is unchanged. Bump the
+# version when the HTML generation changes so stale entries are ignored.
+HTML_CACHE_DIR = PROJECT_ROOT / ".cache" / "pdf"
+HTML_CACHE_VERSION = 2
+
+
+def check_dependencies(engine: str = 'weasyprint'):
+    """Check if required dependencies for the given rendering engine are installed"""
     try:
-        import markdown
-        import weasyprint
+        import mistune
+        if engine == 'chromium':
+            import playwright.sync_api
+        else:
+            import weasyprint
         return True
     except ImportError as e:
         print(f"Missing dependencies: {e}")
         print("\nInstall with:")
-        print("  pip install markdown weasyprint")
+        if engine == 'chromium':
+            print("  pip install mistune playwright && playwright install chromium")
+        else:
+            print("  pip install mistune weasyprint")
         return False
 
 
-def markdown_to_pdf(markdown_file: Path, output_pdf: Optional[Path] = None):
-    """
-    Convert markdown file to PDF with professional styling
-
-    Args:
-        markdown_file: Path to markdown file
-        output_pdf: Optional output PDF path (default: same name as markdown with .pdf)
-    """
-    import markdown
-    from weasyprint import HTML, CSS
-
-    # Read markdown
-    with open(markdown_file, 'r', encoding='utf-8') as f:
-        md_content = f.read()
+_CSS_TEXT = """
+@page {
+    size: A4;
+    margin: 2.5cm 2cm;
+    @top-right {
+        content: "Page " counter(page);
+        font-size: 9pt;
+        color: #666;
+    }
+}
+
+body {
+    font-family: 'Helvetica', 'Arial', sans-serif;
+    font-size: 11pt;
+    line-height: 1.6;
+    color: #333;
+    max-width: 100%;
+}
+
+h1 {
+    color: #1a5490;
+    font-size: 24pt;
+    font-weight: bold;
+    margin-top: 0;
+    margin-bottom: 10pt;
+    border-bottom: 3px solid #1a5490;
+    padding-bottom: 10pt;
+}
+
+h2 {
+    color: #2c5f8d;
+    font-size: 18pt;
+    font-weight: bold;
+    margin-top: 20pt;
+    margin-bottom: 10pt;
+    border-bottom: 1px solid #ccc;
+    padding-bottom: 5pt;
+}
+
+h3 {
+    color: #34495e;
+    font-size: 14pt;
+    font-weight: bold;
+    margin-top: 15pt;
+    margin-bottom: 8pt;
+}
+
+h4 {
+    color: #555;
+    font-size: 12pt;
+    font-weight: bold;
+    margin-top: 12pt;
+    margin-bottom: 6pt;
+}
+
+p {
+    margin: 8pt 0;
+    text-align: justify;
+}
+
+ul, ol {
+    margin: 10pt 0;
+    padding-left: 25pt;
+}
+
+li {
+    margin: 5pt 0;
+}
+
+table {
+    width: 100%;
+    border-collapse: collapse;
+    margin: 15pt 0;
+    font-size: 10pt;
+}
+
+th {
+    background-color: #1a5490;
+    color: white;
+    font-weight: bold;
+    padding: 8pt;
+    text-align: left;
+    border: 1px solid #ddd;
+}
+
+td {
+    padding: 6pt 8pt;
+    border: 1px solid #ddd;
+}
+
+tr:nth-child(even) {
+    background-color: #f9f9f9;
+}
+
+code {
+    background-color: #f4f4f4;
+    padding: 2pt 4pt;
+    font-family: 'Courier New', monospace;
+    font-size: 9pt;
+    border-radius: 3pt;
+}
+
+pre {
+    background-color: #f4f4f4;
+    padding: 10pt;
+    border-left: 3px solid #1a5490;
+    overflow-x: auto;
+    font-size: 9pt;
+    line-height: 1.4;
+}
+
+pre code {
+    background-color: transparent;
+    padding: 0;
+}
+
+blockquote {
+    margin: 15pt 0;
+    padding: 10pt 15pt;
+    background-color: #f9f9f9;
+    border-left: 4px solid #1a5490;
+    font-style: italic;
+}
+
+hr {
+    border: none;
+    border-top: 2px solid #ccc;
+    margin: 20pt 0;
+}
+
+.warning {
+    background-color: #fff3cd;
+    border-left: 4px solid #ffc107;
+    padding: 10pt;
+    margin: 15pt 0;
+}
+
+.error {
+    background-color: #f8d7da;
+    border-left: 4px solid #dc3545;
+    padding: 10pt;
+    margin: 15pt 0;
+}
+
+.success {
+    background-color: #d4edda;
+    border-left: 4px solid #28a745;
+    padding: 10pt;
+    margin: 15pt 0;
+}
+
+.metadata {
+    background-color: #e9ecef;
+    padding: 10pt;
+    margin-bottom: 20pt;
+    border-radius: 5pt;
+    font-size: 10pt;
+}
+
+a {
+    color: #1a5490;
+    text-decoration: none;
+}
+
+a:hover {
+    text-decoration: underline;
+}
+"""
 
-    # Convert markdown to HTML
-    md = markdown.Markdown(extensions=[
-        'extra',
-        'codehilite',
-        'toc',
-        'tables',
-        'fenced_code'
-    ])
-    html_content = md.convert(md_content)
 
-    # Generate styled HTML document
-    styled_html = f"""
+# Document wrapper around each report body: title and optional inline
+# stylesheet, then the generation timestamp
+_DOC_PREFIX = """
 <!DOCTYPE html>
 <html>
 <head>
     <meta charset="utf-8">
-    <title>{markdown_file.stem}</title>
-    <style>
-        @page {{
-            size: A4;
-            margin: 2.5cm 2cm;
-            @top-right {{
-                content: "Page " counter(page);
-                font-size: 9pt;
-                color: #666;
-            }}
-        }}
-
-        body {{
-            font-family: 'Helvetica', 'Arial', sans-serif;
-            font-size: 11pt;
-            line-height: 1.6;
-            color: #333;
-            max-width: 100%;
-        }}
-
-        h1 {{
-            color: #1a5490;
-            font-size: 24pt;
-            font-weight: bold;
-            margin-top: 0;
-            margin-bottom: 10pt;
-            border-bottom: 3px solid #1a5490;
-            padding-bottom: 10pt;
-        }}
-
-        h2 {{
-            color: #2c5f8d;
-            font-size: 18pt;
-            font-weight: bold;
-            margin-top: 20pt;
-            margin-bottom: 10pt;
-            border-bottom: 1px solid #ccc;
-            padding-bottom: 5pt;
-        }}
-
-        h3 {{
-            color: #34495e;
-            font-size: 14pt;
-            font-weight: bold;
-            margin-top: 15pt;
-            margin-bottom: 8pt;
-        }}
-
-        h4 {{
-            color: #555;
-            font-size: 12pt;
-            font-weight: bold;
-            margin-top: 12pt;
-            margin-bottom: 6pt;
-        }}
-
-        p {{
-            margin: 8pt 0;
-            text-align: justify;
-        }}
-
-        ul, ol {{
-            margin: 10pt 0;
-            padding-left: 25pt;
-        }}
-
-        li {{
-            margin: 5pt 0;
-        }}
-
-        table {{
-            width: 100%;
-            border-collapse: collapse;
-            margin: 15pt 0;
-            font-size: 10pt;
-        }}
-
-        th {{
-            background-color: #1a5490;
-            color: white;
-            font-weight: bold;
-            padding: 8pt;
-            text-align: left;
-            border: 1px solid #ddd;
-        }}
-
-        td {{
-            padding: 6pt 8pt;
-            border: 1px solid #ddd;
-        }}
-
-        tr:nth-child(even) {{
-            background-color: #f9f9f9;
-        }}
-
-        code {{
-            background-color: #f4f4f4;
-            padding: 2pt 4pt;
-            font-family: 'Courier New', monospace;
-            font-size: 9pt;
-            border-radius: 3pt;
-        }}
-
-        pre {{
-            background-color: #f4f4f4;
-            padding: 10pt;
-            border-left: 3px solid #1a5490;
-            overflow-x: auto;
-            font-size: 9pt;
-            line-height: 1.4;
-        }}
-
-        pre code {{
-            background-color: transparent;
-            padding: 0;
-        }}
-
-        blockquote {{
-            margin: 15pt 0;
-            padding: 10pt 15pt;
-            background-color: #f9f9f9;
-            border-left: 4px solid #1a5490;
-            font-style: italic;
-        }}
-
-        hr {{
-            border: none;
-            border-top: 2px solid #ccc;
-            margin: 20pt 0;
-        }}
-
-        .warning {{
-            background-color: #fff3cd;
-            border-left: 4px solid #ffc107;
-            padding: 10pt;
-            margin: 15pt 0;
-        }}
-
-        .error {{
-            background-color: #f8d7da;
-            border-left: 4px solid #dc3545;
-            padding: 10pt;
-            margin: 15pt 0;
-        }}
-
-        .success {{
-            background-color: #d4edda;
-            border-left: 4px solid #28a745;
-            padding: 10pt;
-            margin: 15pt 0;
-        }}
-
-        .metadata {{
-            background-color: #e9ecef;
-            padding: 10pt;
-            margin-bottom: 20pt;
-            border-radius: 5pt;
-            font-size: 10pt;
-        }}
-
-        a {{
-            color: #1a5490;
-            text-decoration: none;
-        }}
-
-        a:hover {{
-            text-decoration: underline;
-        }}
-    </style>
+    <title>%s</title>
+    %s
 </head>
 <body>
-{html_content}
+"""
+
+_DOC_SUFFIX = """
 <div style="margin-top: 30pt; padding-top: 10pt; border-top: 1px solid #ccc; font-size: 9pt; color: #666;">
-    <p>Generated: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}</p>
+    <p>Generated: %s</p>
 </div>
 </body>
 </html>
 """
 
+
+@lru_cache(maxsize=1)
+def _stylesheet():
+    """
+    Parse the report stylesheet once per process
+
+    Returns (css, font_config); the same FontConfiguration must be passed to
+    write_pdf alongside the stylesheet it was used to parse.
+    """
+    from weasyprint import CSS
+    from weasyprint.text.fonts import FontConfiguration
+
+    font_config = FontConfiguration()
+    return CSS(string=_CSS_TEXT, font_config=font_config), font_config
+
+
+def markdown_to_pdf(markdown_file: Path, output_pdf: Optional[Path] = None,
+                    engine: str = 'weasyprint'):
+    """
+    Convert markdown file to PDF with professional styling
+
+    Args:
+        markdown_file: Path to markdown file
+        output_pdf: Optional output PDF path (default: same name as markdown with .pdf)
+        engine: Rendering engine ('weasyprint' or 'chromium')
+    """
+    html_content = _cached_html(markdown_file, _markdown_html)
+
     # Determine output path
     if output_pdf is None:
         output_pdf = markdown_file.parent / "pdf" / f"{markdown_file.stem}.pdf"
 
+    return _render_html_to_pdf(html_content, markdown_file.stem, output_pdf, engine)
+
+
+def _markdown_html(markdown_file: Path) -> str:
+    """Convert a markdown file to an HTML body"""
+    # Read markdown
+    with open(markdown_file, 'r', encoding='utf-8') as f:
+        md_content = f.read()
+
+    return _markdown_renderer()(md_content)
+
+
+@lru_cache(maxsize=1)
+def _markdown_renderer():
+    """
+    Build the markdown parser once per process
+
+    Single-pass parser with only the plugins the reports use; raw HTML is
+    passed through as python-markdown did.
+    """
+    import mistune
+
+    return mistune.create_markdown(
+        escape=False,
+        plugins=['table', 'strikethrough', 'footnotes', 'url']
+    )
+
+
+def _cached_html(source: Path, render: Callable[[Path], str]) -> str:
+    """
+    Return render(source), reusing the result from a previous run if the
+    source file is unchanged
+
+    Entries are keyed by the source path, modification time and size, so
+    editing or regenerating the source invalidates them.
+    """
+    stat = source.stat()
+    key_text = f"{HTML_CACHE_VERSION}:{source.resolve()}:{stat.st_mtime_ns}:{stat.st_size}"
+    key = hashlib.blake2b(key_text.encode('utf-8'), digest_size=16).hexdigest()
+    cache_file = HTML_CACHE_DIR / f"{key}.html"
+
+    try:
+        return cache_file.read_text(encoding='utf-8')
+    except FileNotFoundError:
+        pass
+
+    html_content = render(source)
+    HTML_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+    tmp_file.write_text(html_content, encoding='utf-8')
+    os.replace(tmp_file, cache_file)
+    return html_content
+
+
+def _render_html_to_pdf(html_content: str, title: str, output_pdf: Path,
+                        engine: str = 'weasyprint') -> Path:
+    """
+    Wrap an HTML body in the report document and render it to PDF
+
+    Args:
+        html_content: HTML body content
+        title: Document title
+        output_pdf: Output PDF path (parent directories are created)
+        engine: Rendering engine ('weasyprint' or 'chromium')
+    """
+    # WeasyPrint gets the pre-parsed stylesheet separately; Chromium needs it
+    # inline in the document
+    style_block = f"<style>{_CSS_TEXT}</style>" if engine == 'chromium' else ""
+
+    # Generate styled HTML document
+    styled_html = (
+        _DOC_PREFIX % (escape(title), style_block)
+        + html_content
+        + _DOC_SUFFIX % datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    )
+
     # Create output directory
     output_pdf.parent.mkdir(parents=True, exist_ok=True)
 
     # Convert HTML to PDF
     print(f"Generating PDF: {output_pdf}")
-    HTML(string=styled_html).write_pdf(output_pdf)
-    print(f"✓ PDF generated successfully")
+    if engine == 'chromium':
+        _render_chromium(styled_html, output_pdf)
+        print(f"✓ PDF generated successfully")
+        return output_pdf
+
+    from weasyprint import HTML
+
+    # Lay the document out once against the shared stylesheet, then serialize
+    # the rendered pages; layout and serialization are separate passes
+    css, font_config = _stylesheet()
+    document = HTML(string=styled_html).render(stylesheets=[css], font_config=font_config)
+    document.write_pdf(output_pdf)
+    print(f"✓ PDF generated successfully ({len(document.pages)} pages)")
 
     return output_pdf
 
 
-def generate_bilateral_impact_pdf(json_file: Path, output_pdf: Optional[Path] = None):
+def _render_chromium(styled_html: str, output_pdf: Path):
+    """
+    Print a self-contained HTML document to PDF with headless Chromium
+
+    Much faster than WeasyPrint's layout on very large reports. Page size,
+    margins and the page counter come from the stylesheet's @page rule.
+    """
+    from playwright.sync_api import sync_playwright
+
+    with sync_playwright() as p:
+        browser = p.chromium.launch()
+        try:
+            page = browser.new_page()
+            page.set_content(styled_html, wait_until='load')
+            page.pdf(path=str(output_pdf), prefer_css_page_size=True, print_background=True)
+        finally:
+            browser.close()
+
+
+def generate_bilateral_impact_pdf(json_file: Path, output_pdf: Optional[Path] = None,
+                                  engine: str = 'weasyprint'):
     """
     Generate PDF report from bilateral impact analysis JSON
 
     Args:
         json_file: Path to JSON analysis results
         output_pdf: Optional output PDF path
+        engine: Rendering engine ('weasyprint' or 'chromium')
     """
-    # Load JSON data
-    with open(json_file, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-
-    # Generate markdown report
-    md_content = f"""# Israel Bilateral Relationship Impact Analysis
+    html_content = _cached_html(json_file, _bilateral_report_html)
 
-**Motion:** {data['motion_id']}
-**Analysis Date:** {data['timestamp']}
-**Model:** {data['model']}
-**Countries Analyzed:** {data['total_analyzed']}
+    # Convert to PDF
+    title = f"{json_file.stem}_report"
+    if output_pdf is None:
+        output_pdf = json_file.parent / "pdf" / f"{title}.pdf"
 
----
+    return _render_html_to_pdf(html_content, title, output_pdf, engine)
 
-## Executive Summary
 
-This report analyzes how the Gaza ceasefire resolution vote affects Israel's bilateral relationships with {data['total_analyzed']} UN member states.
+def _bilateral_report_html(json_file: Path) -> str:
+    """Build the bilateral impact report HTML body from analysis JSON"""
+    # Load JSON data
+    data = load_json(json_file)
 
-### Impact Distribution
+    # Build the report HTML directly; the data is structured, so there is no
+    # need to round-trip it through markdown
+    total = data['total_analyzed']
 
-"""
+    parts = [
+        "<h1>Israel Bilateral Relationship Impact Analysis</h1>\n",
+        f"<p><strong>Motion:</strong> {escape(data['motion_id'])}<br />\n",
+        f"<strong>Analysis Date:</strong> {escape(data['timestamp'])}<br />\n",
+        f"<strong>Model:</strong> {escape(data['model'])}<br />\n",
+        f"<strong>Countries Analyzed:</strong> {total}</p>\n",
+        "<hr />\n",
+        "<h2>Executive Summary</h2>\n",
+        f"<p>This report analyzes how the Gaza ceasefire resolution vote affects Israel's "
+        f"bilateral relationships with {total} UN member states.</p>\n",
+        "<h3>Impact Distribution</h3>\n",
+        "<table>\n<thead>\n<tr><th>Impact Category</th><th>Count</th><th>Percentage</th></tr>\n</thead>\n<tbody>\n",
+    ]
 
     # Add impact summary table
-    md_content += "| Impact Category | Count | Percentage |\n"
-    md_content += "|----------------|-------|------------|\n"
-
-    total = data['total_analyzed']
     for category, count in data['impact_summary'].items():
         pct = (count / total * 100) if total > 0 else 0
-        md_content += f"| {category.replace('_', ' ').title()} | {count} | {pct:.1f}% |\n"
+        parts.append(f"<tr><td>{escape(category.replace('_', ' ').title())}</td>"
+                     f"<td>{count}</td><td>{pct:.1f}%</td></tr>\n")
 
-    md_content += "\n---\n\n"
+    parts.append("</tbody>\n</table>\n<hr />\n")
 
     # Group analyses by impact category
-    by_category = {}
-    for analysis in data['analyses']:
-        category = analysis['impact_analysis']['impact_category']
-        if category not in by_category:
-            by_category[category] = []
-        by_category[category].append(analysis)
+    by_category = group_by_category(data['analyses'])
 
     # Add detailed analyses by category
     category_order = [
@@ -329,36 +467,38 @@ This report analyzes how the Gaza ceasefire resolution vote affects Israel's bil
         if category not in by_category or not by_category[category]:
             continue
 
-        md_content += f"## {category.replace('_', ' ').title()}\n\n"
+        parts.append(f"<h2>{escape(category.replace('_', ' ').title())}</h2>\n")
 
         for analysis in by_category[category]:
-            md_content += f"### {analysis['country']}\n\n"
-            md_content += f"**Vote:** {analysis['vote'].upper()}  \n"
-            md_content += f"**Confidence:** {analysis['impact_analysis']['confidence']}  \n\n"
-
-            md_content += f"**Analysis:**  \n"
-            md_content += f"{analysis['impact_analysis']['reasoning']}\n\n"
+            impact = analysis['impact_analysis']
+            parts.append(f"<h3>{escape(analysis['country'])}</h3>\n")
+            parts.append(f"<p><strong>Vote:</strong> {escape(analysis['vote'].upper())}<br />\n"
+                         f"<strong>Confidence:</strong> {escape(impact['confidence'])}</p>\n")
 
-            md_content += f"**Key Factors:**\n"
-            for factor in analysis['impact_analysis']['key_factors']:
-                md_content += f"- {factor}\n"
+            parts.append(f"<p><strong>Analysis:</strong><br />\n{escape(impact['reasoning'])}</p>\n")
 
-            md_content += f"\n**Country Statement:**  \n"
-            md_content += f"> {analysis['statement']}\n\n"
-            md_content += "---\n\n"
+            parts.append("<p><strong>Key Factors:</strong></p>\n<ul>\n")
+            for factor in impact['key_factors']:
+                parts.append(f"<li>{escape(factor)}</li>\n")
+            parts.append("</ul>\n")
 
-    # Save markdown temporarily
-    temp_md = json_file.parent / f"{json_file.stem}_report.md"
-    with open(temp_md, 'w', encoding='utf-8') as f:
-        f.write(md_content)
+            parts.append("<p><strong>Country Statement:</strong></p>\n")
+            parts.append(f"<blockquote>\n<p>{escape(analysis['statement'])}</p>\n</blockquote>\n")
+            parts.append("<hr />\n")
 
-    # Convert to PDF
-    pdf_path = markdown_to_pdf(temp_md, output_pdf)
+    return "".join(parts)
 
-    # Clean up temp markdown
-    temp_md.unlink()
 
-    return pdf_path
+def convert_file(input_file: Path, output_pdf: Optional[Path] = None,
+                 engine: str = 'weasyprint') -> Path:
+    """Convert a .md or .json input file to PDF based on its suffix"""
+    if input_file.suffix == '.json':
+        print("Processing bilateral impact JSON...")
+        return generate_bilateral_impact_pdf(input_file, output_pdf, engine)
+    if input_file.suffix == '.md':
+        print("Processing markdown file...")
+        return markdown_to_pdf(input_file, output_pdf, engine)
+    raise ValueError(f"Unsupported file type: {input_file.suffix} (supported types: .md, .json)")
 
 
 def main():
@@ -373,47 +513,63 @@ Examples:
   # Convert JSON bilateral impact to PDF
   python scripts/generate_pdf_report.py analysis/01_gaza_ceasefire_resolution_israel_bilateral_impact_latest.json
 
+  # Convert several files in parallel
+  python scripts/generate_pdf_report.py analysis/*.md
+
   # Specify output path
   python scripts/generate_pdf_report.py analysis/report.md --output custom_report.pdf
+
+  # Render a large report with headless Chromium instead of WeasyPrint
+  python scripts/generate_pdf_report.py analysis/report.json --engine chromium
         """
     )
 
     parser.add_argument(
-        "input_file",
+        "input_files",
+        nargs='+',
         type=Path,
-        help="Input file (.md or .json)"
+        metavar="input_file",
+        help="Input file(s) (.md or .json)"
     )
 
     parser.add_argument(
         "--output",
         type=Path,
-        help="Output PDF file (optional)"
+        help="Output PDF file (optional, single input only)"
+    )
+
+    parser.add_argument(
+        "--engine",
+        choices=['weasyprint', 'chromium'],
+        default='weasyprint',
+        help="PDF rendering engine (default: weasyprint; chromium requires playwright)"
     )
 
     args = parser.parse_args()
 
-    # Check dependencies
-    if not check_dependencies():
-        sys.exit(1)
+    if args.output and len(args.input_files) > 1:
+        parser.error("--output can only be used with a single input file")
 
-    # Validate input file
-    if not args.input_file.exists():
-        print(f"Error: Input file not found: {args.input_file}")
+    # Check dependencies
+    if not check_dependencies(args.engine):
         sys.exit(1)
 
-    try:
-        # Determine file type and process accordingly
-        if args.input_file.suffix == '.json':
-            print("Processing bilateral impact JSON...")
-            pdf_path = generate_bilateral_impact_pdf(args.input_file, args.output)
-        elif args.input_file.suffix == '.md':
-            print("Processing markdown file...")
-            pdf_path = markdown_to_pdf(args.input_file, args.output)
-        else:
-            print(f"Error: Unsupported file type: {args.input_file.suffix}")
+    # Validate input files
+    for input_file in args.input_files:
+        if not input_file.exists():
+            print(f"Error: Input file not found: {input_file}")
+            sys.exit(1)
+        if input_file.suffix not in ('.md', '.json'):
+            print(f"Error: Unsupported file type: {input_file.suffix}")
             print("Supported types: .md, .json")
             sys.exit(1)
 
+    if len(args.input_files) > 1:
+        sys.exit(_convert_parallel(args.input_files, args.engine))
+
+    try:
+        pdf_path = convert_file(args.input_files[0], args.output, args.engine)
+
         print(f"\n✓ PDF report generated: {pdf_path}")
         print(f"  Size: {pdf_path.stat().st_size / 1024:.1f} KB")
 
@@ -424,5 +580,29 @@ Examples:
         sys.exit(1)
 
 
+def _convert_parallel(input_files: List[Path], engine: str = 'weasyprint') -> int:
+    """
+    Convert each input file in a worker process
+
+    Rendering is CPU-bound and files share no state, so this scales with
+    cores. Returns the process exit code (1 if any conversion failed).
+    """
+    exit_code = 0
+    workers = min(len(input_files), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(convert_file, input_file, None, engine): input_file
+                   for input_file in input_files}
+        for future in as_completed(futures):
+            try:
+                pdf_path = future.result()
+            except Exception as e:
+                print(f"\n❌ Error generating PDF ({futures[future]}): {e}")
+                exit_code = 1
+                continue
+            print(f"\n✓ PDF report generated: {pdf_path}")
+            print(f"  Size: {pdf_path.stat().st_size / 1024:.1f} KB")
+    return exit_code
+
+
 if __name__ == "__main__":
     main()
@@ -7,15 +7,20 @@ requiring heavy dependencies like weasyprint.
 
 Usage:
     python scripts/generate_simple_pdf.py <input_file> [--output output.pdf]
+    python scripts/generate_simple_pdf.py --batch "<glob>" [--workers N]
 
 Example:
     python scripts/generate_simple_pdf.py analysis/01_gaza_ceasefire_resolution_israel_bilateral_impact_latest.json
 """
 
 import argparse
-import json
+import glob
+import os
+import re
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, List, Dict
 
@@ -23,64 +28,47 @@ from typing import Optional, List, Dict
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
+from reporting import group_by_category
+from storage import load_json
 
-def check_dependencies():
-    """Check if required dependencies are installed"""
-    try:
-        from reportlab.lib.pagesizes import letter, A4
-        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
-        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-        from reportlab.lib.units import inch
-        from reportlab.lib import colors
-        return True
-    except ImportError as e:
-        print(f"Missing dependency: reportlab")
-        print("\nInstall with:")
-        print("  pip install reportlab")
-        return False
+# Longest statement shown in full in the detailed analyses
+STATEMENT_EXCERPT_CHARS = 500
 
+# Paragraph text is parsed as XML-like markup, so every data-derived field is
+# escaped with this table before being combined with the report's own markup
+_XML_ESCAPES = str.maketrans({'<': '&lt;', '>': '&gt;', '&': '&amp;'})
 
-def generate_bilateral_impact_pdf(json_file: Path, output_pdf: Optional[Path] = None):
-    """
-    Generate PDF report from bilateral impact analysis JSON
+# Markdown line prefixes: a heading (group 1), an emphasised line (group 2) or
+# a horizontal rule (group 3); anything else is body text
+_MD_LINE = re.compile(r'(#{1,3}) |(\*)|(---)')
+_MD_HEADING_STYLES = {1: 'CustomTitle', 2: 'Heading2', 3: 'Heading3'}
 
-    Args:
-        json_file: Path to JSON analysis results
-        output_pdf: Optional output PDF path
-    """
-    from reportlab.lib.pagesizes import letter, A4
-    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
+try:
+    from reportlab.lib import colors
+    from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY
+    from reportlab.lib.pagesizes import A4
     from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
     from reportlab.lib.units import inch
-    from reportlab.lib import colors
-    from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_JUSTIFY
-
-    # Load JSON data
-    with open(json_file, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-
-    # Determine output path
-    if output_pdf is None:
-        output_pdf = json_file.parent / "pdf" / f"{json_file.stem}.pdf"
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
+    _HAS_REPORTLAB = True
+except ImportError:
+    _HAS_REPORTLAB = False
 
-    # Create output directory
-    output_pdf.parent.mkdir(parents=True, exist_ok=True)
 
-    # Create PDF
-    doc = SimpleDocTemplate(
-        str(output_pdf),
-        pagesize=A4,
-        rightMargin=72,
-        leftMargin=72,
-        topMargin=72,
-        bottomMargin=18,
-    )
+def check_dependencies():
+    """Check if required dependencies are installed"""
+    if not _HAS_REPORTLAB:
+        print("Missing dependency: reportlab")
+        print("\nInstall with:")
+        print("  pip install reportlab")
+    return _HAS_REPORTLAB
 
-    # Container for the 'Flowable' objects
-    elements = []
 
-    # Define styles
+@lru_cache(maxsize=1)
+def _report_styles():
+    """Build the bilateral impact report's paragraph styles once and reuse them across calls"""
     styles = getSampleStyleSheet()
+
     styles.add(ParagraphStyle(
         name='CustomTitle',
         parent=styles['Heading1'],
@@ -116,6 +104,103 @@ def generate_bilateral_impact_pdf(json_file: Path, output_pdf: Optional[Path] =
         leading=14
     ))
 
+    return styles
+
+
+@lru_cache(maxsize=1)
+def _report_table_styles():
+    """Build the bilateral impact report's table styles once and reuse them across calls"""
+    return {
+        'Impact': TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1a5490')),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 11),
+            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+            ('BACKGROUND', (0, 1), (-1, -1), colors.white),
+            ('GRID', (0, 0), (-1, -1), 1, colors.grey),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f9f9f9')]),
+        ]),
+        'Country': TableStyle([
+            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (0, -1), 10),
+            ('LEFTPADDING', (0, 0), (0, -1), 0),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+            ('LINEBELOW', (0, 0), (-1, -2), 0.25, colors.HexColor('#dddddd')),
+        ]),
+    }
+
+
+@lru_cache(maxsize=1)
+def _markdown_styles():
+    """Build the markdown report's paragraph styles once and reuse them across calls"""
+    styles = getSampleStyleSheet()
+
+    styles.add(ParagraphStyle(
+        name='CustomTitle',
+        parent=styles['Heading1'],
+        fontSize=20,
+        textColor=colors.HexColor('#1a5490'),
+        spaceAfter=20,
+        fontName='Helvetica-Bold'
+    ))
+    styles.add(ParagraphStyle(
+        name='Justified',
+        parent=styles['Normal'],
+        alignment=TA_JUSTIFY,
+        fontSize=10,
+        leading=14
+    ))
+
+    return styles
+
+
+def generate_bilateral_impact_pdf(json_file: Path, output_pdf: Optional[Path] = None):
+    """
+    Generate PDF report from bilateral impact analysis JSON
+
+    Args:
+        json_file: Path to JSON analysis results
+        output_pdf: Optional output PDF path
+    """
+    # Load JSON data
+    data = load_json(json_file)
+
+    # Statement excerpts for the detailed analyses, trimmed and escaped once on load
+    for analysis in data['analyses']:
+        statement = analysis.get('statement', '')
+        if len(statement) > STATEMENT_EXCERPT_CHARS:
+            statement = statement[:STATEMENT_EXCERPT_CHARS] + "..."
+        analysis['_display'] = statement.translate(_XML_ESCAPES)
+
+    # Determine output path
+    if output_pdf is None:
+        output_pdf = json_file.parent / "pdf" / f"{json_file.stem}.pdf"
+
+    # Create output directory
+    output_pdf.parent.mkdir(parents=True, exist_ok=True)
+
+    # Create PDF
+    doc = SimpleDocTemplate(
+        str(output_pdf),
+        pagesize=A4,
+        rightMargin=72,
+        leftMargin=72,
+        topMargin=72,
+        bottomMargin=18,
+        pageCompression=1,
+        invariant=0,
+    )
+
+    # Container for the 'Flowable' objects
+    elements = []
+
+    styles = _report_styles()
+    table_styles = _report_table_styles()
+
     # Title
     title = Paragraph("Israel Bilateral Relationship Impact Analysis", styles['CustomTitle'])
     elements.append(title)
@@ -123,9 +208,9 @@ def generate_bilateral_impact_pdf(json_file: Path, output_pdf: Optional[Path] =
 
     # Metadata
     metadata = [
-        f"<b>Motion:</b> {data['motion_id']}",
-        f"<b>Analysis Date:</b> {data['timestamp']}",
-        f"<b>Model:</b> {data['model']}",
+        f"<b>Motion:</b> {data['motion_id'].translate(_XML_ESCAPES)}",
+        f"<b>Analysis Date:</b> {data['timestamp'].translate(_XML_ESCAPES)}",
+        f"<b>Model:</b> {data['model'].translate(_XML_ESCAPES)}",
         f"<b>Countries Analyzed:</b> {data['total_analyzed']}"
     ]
     for line in metadata:
@@ -152,18 +237,7 @@ def generate_bilateral_impact_pdf(json_file: Path, output_pdf: Optional[Path] =
         ])
 
     impact_table = Table(impact_data, colWidths=[3.5*inch, 1*inch, 1*inch])
-    impact_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1a5490')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 11),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-        ('GRID', (0, 0), (-1, -1), 1, colors.grey),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f9f9f9')]),
-    ]))
+    impact_table.setStyle(table_styles['Impact'])
     elements.append(impact_table)
     elements.append(Spacer(1, 0.3*inch))
 
@@ -173,12 +247,7 @@ def generate_bilateral_impact_pdf(json_file: Path, output_pdf: Optional[Path] =
     elements.append(Spacer(1, 0.2*inch))
 
     # Group analyses by impact category
-    by_category = {}
-    for analysis in data['analyses']:
-        category = analysis['impact_analysis']['impact_category']
-        if category not in by_category:
-            by_category[category] = []
-        by_category[category].append(analysis)
+    by_category = group_by_category(data['analyses'])
 
     # Category order
     category_order = [
@@ -203,35 +272,31 @@ def generate_bilateral_impact_pdf(json_file: Path, output_pdf: Optional[Path] =
         elements.append(Spacer(1, 0.1*inch))
 
         for i, analysis in enumerate(by_category[category]):
+            impact = analysis['impact_analysis']
+
             # Country name
             elements.append(Paragraph(
-                f"<b>{analysis['country']}</b>",
+                f"<b>{analysis['country'].translate(_XML_ESCAPES)}</b>",
                 styles['CustomSubHeading']
             ))
 
-            # Vote and confidence
-            info_text = f"<b>Vote:</b> {analysis['vote'].upper()} | <b>Confidence:</b> {analysis['impact_analysis']['confidence']}"
-            elements.append(Paragraph(info_text, styles['Normal']))
-            elements.append(Spacer(1, 0.1*inch))
-
-            # Analysis reasoning
-            elements.append(Paragraph("<b>Analysis:</b>", styles['Normal']))
-            reasoning = analysis['impact_analysis']['reasoning']
-            elements.append(Paragraph(reasoning, styles['Justified']))
-            elements.append(Spacer(1, 0.1*inch))
-
-            # Key factors
-            elements.append(Paragraph("<b>Key Factors:</b>", styles['Normal']))
-            for factor in analysis['impact_analysis']['key_factors']:
-                elements.append(Paragraph(f"• {factor}", styles['Normal']))
-            elements.append(Spacer(1, 0.1*inch))
-
-            # Country statement
-            elements.append(Paragraph("<b>Country Statement:</b>", styles['Normal']))
-            statement = analysis['statement']
-            if len(statement) > 500:
-                statement = statement[:500] + "..."
-            elements.append(Paragraph(statement, styles['Justified']))
+            # Vote, analysis, key factors and statement laid out as one label | content table
+            country_data = [
+                ['Vote', Paragraph(
+                    f"{analysis['vote'].upper().translate(_XML_ESCAPES)} | "
+                    f"<b>Confidence:</b> {impact['confidence'].translate(_XML_ESCAPES)}",
+                    styles['Normal']
+                )],
+                ['Analysis', Paragraph(impact['reasoning'].translate(_XML_ESCAPES), styles['Justified'])],
+                ['Key Factors', Paragraph(
+                    '<br/>'.join(f"• {factor.translate(_XML_ESCAPES)}" for factor in impact['key_factors']),
+                    styles['Normal']
+                )],
+                ['Statement', Paragraph(analysis['_display'], styles['Justified'])],
+            ]
+            country_table = Table(country_data, colWidths=[1.1*inch, 5.1*inch])
+            country_table.setStyle(table_styles['Country'])
+            elements.append(country_table)
 
             # Separator between countries
             if i < len(by_category[category]) - 1:
@@ -261,13 +326,6 @@ def generate_markdown_pdf(md_file: Path, output_pdf: Optional[Path] = None):
         md_file: Path to markdown file
         output_pdf: Optional output PDF path
     """
-    from reportlab.lib.pagesizes import A4
-    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak
-    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-    from reportlab.lib.units import inch
-    from reportlab.lib import colors
-    from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_JUSTIFY
-
     # Read markdown
     with open(md_file, 'r', encoding='utf-8') as f:
         md_content = f.read()
@@ -287,27 +345,12 @@ def generate_markdown_pdf(md_file: Path, output_pdf: Optional[Path] = None):
         leftMargin=72,
         topMargin=72,
         bottomMargin=18,
+        pageCompression=1,
+        invariant=0,
     )
 
     elements = []
-    styles = getSampleStyleSheet()
-
-    # Add custom styles
-    styles.add(ParagraphStyle(
-        name='CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=20,
-        textColor=colors.HexColor('#1a5490'),
-        spaceAfter=20,
-        fontName='Helvetica-Bold'
-    ))
-    styles.add(ParagraphStyle(
-        name='Justified',
-        parent=styles['Normal'],
-        alignment=TA_JUSTIFY,
-        fontSize=10,
-        leading=14
-    ))
+    styles = _markdown_styles()
 
     # Simple markdown parsing (basic headers and paragraphs)
     lines = md_content.split('\n')
@@ -317,18 +360,16 @@ def generate_markdown_pdf(md_file: Path, output_pdf: Optional[Path] = None):
             elements.append(Spacer(1, 0.1*inch))
             continue
 
-        if line.startswith('# '):
-            elements.append(Paragraph(line[2:], styles['CustomTitle']))
-        elif line.startswith('## '):
-            elements.append(Paragraph(line[3:], styles['Heading2']))
-        elif line.startswith('### '):
-            elements.append(Paragraph(line[4:], styles['Heading3']))
-        elif line.startswith('**') or line.startswith('*'):
+        match = _MD_LINE.match(line)
+        if match is None:
+            elements.append(Paragraph(line, styles['Justified']))
+        elif match.lastindex == 1:
+            heading_style = _MD_HEADING_STYLES[len(match.group(1))]
+            elements.append(Paragraph(line[match.end():], styles[heading_style]))
+        elif match.lastindex == 2:
             elements.append(Paragraph(line, styles['Normal']))
-        elif line.startswith('---'):
-            elements.append(Spacer(1, 0.2*inch))
         else:
-            elements.append(Paragraph(line, styles['Justified']))
+            elements.append(Spacer(1, 0.2*inch))
 
     # Build PDF
     print(f"Generating PDF: {output_pdf}")
@@ -338,6 +379,43 @@ def generate_markdown_pdf(md_file: Path, output_pdf: Optional[Path] = None):
     return output_pdf
 
 
+def convert_file(input_file: Path, output_pdf: Optional[Path] = None) -> Path:
+    """Convert a .md or .json input file to PDF based on its suffix"""
+    if input_file.suffix == '.json':
+        print("Processing bilateral impact JSON...")
+        return generate_bilateral_impact_pdf(input_file, output_pdf)
+    if input_file.suffix == '.md':
+        print("Processing markdown file...")
+        return generate_markdown_pdf(input_file, output_pdf)
+    raise ValueError(f"Unsupported file type: {input_file.suffix} (supported types: .md, .json)")
+
+
+def generate_batch(input_files: List[Path], workers: Optional[int] = None) -> int:
+    """
+    Convert each input file in a worker process
+
+    ReportLab layout is CPU-bound and files share no state, so this scales
+    with cores; each worker imports reportlab and builds its styles once and
+    reuses them for every file it is given. Returns the process exit code
+    (1 if any conversion failed).
+    """
+    exit_code = 0
+    workers = min(len(input_files), workers or os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(convert_file, input_file): input_file
+                   for input_file in input_files}
+        for future in as_completed(futures):
+            try:
+                pdf_path = future.result()
+            except Exception as e:
+                print(f"\n❌ Error generating PDF ({futures[future]}): {e}")
+                exit_code = 1
+                continue
+            print(f"\n✓ PDF report generated: {pdf_path}")
+            print(f"  Size: {pdf_path.stat().st_size / 1024:.1f} KB")
+    return exit_code
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Generate PDF reports from analysis results (lightweight version)",
@@ -352,11 +430,15 @@ Examples:
 
   # Specify output path
   python scripts/generate_simple_pdf.py analysis/report.md --output custom.pdf
+
+  # Convert every matching file in parallel
+  python scripts/generate_simple_pdf.py --batch "tasks/analysis/*_latest.json" --workers 4
         """
     )
 
     parser.add_argument(
         "input_file",
+        nargs='?',
         type=Path,
         help="Input file (.md or .json)"
     )
@@ -364,32 +446,54 @@ Examples:
     parser.add_argument(
         "--output",
         type=Path,
-        help="Output PDF file (optional)"
+        help="Output PDF file (optional, single input only)"
+    )
+
+    parser.add_argument(
+        "--batch",
+        metavar="GLOB",
+        help="Convert every .md/.json file matching GLOB (quote it to stop the shell expanding it)"
+    )
+
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Worker processes for --batch (default: number of CPUs)"
     )
 
     args = parser.parse_args()
 
+    if (args.input_file is None) == (args.batch is None):
+        parser.error("give either an input file or --batch GLOB")
+    if args.batch and args.output:
+        parser.error("--output can only be used with a single input file")
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be at least 1")
+
     # Check dependencies
     if not check_dependencies():
         sys.exit(1)
 
+    if args.batch:
+        input_files = sorted(Path(match) for match in glob.glob(args.batch, recursive=True)
+                             if Path(match).suffix in ('.md', '.json'))
+        if not input_files:
+            print(f"Error: No .md or .json files match: {args.batch}")
+            sys.exit(1)
+        print(f"Converting {len(input_files)} files...")
+        sys.exit(generate_batch(input_files, args.workers))
+
     # Validate input file
     if not args.input_file.exists():
         print(f"Error: Input file not found: {args.input_file}")
         sys.exit(1)
+    if args.input_file.suffix not in ('.md', '.json'):
+        print(f"Error: Unsupported file type: {args.input_file.suffix}")
+        print("Supported types: .md, .json")
+        sys.exit(1)
 
     try:
-        # Determine file type and process
-        if args.input_file.suffix == '.json':
-            print("Processing bilateral impact JSON...")
-            pdf_path = generate_bilateral_impact_pdf(args.input_file, args.output)
-        elif args.input_file.suffix == '.md':
-            print("Processing markdown file...")
-            pdf_path = generate_markdown_pdf(args.input_file, args.output)
-        else:
-            print(f"Error: Unsupported file type: {args.input_file.suffix}")
-            print("Supported types: .md, .json")
-            sys.exit(1)
+        pdf_path = convert_file(args.input_file, args.output)
 
         print(f"\n✓ PDF report generated: {pdf_path}")
         print(f"  Size: {pdf_path.stat().st_size / 1024:.1f} KB")
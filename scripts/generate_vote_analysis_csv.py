@@ -7,217 +7,280 @@ a CSV file with detailed analysis including vote distribution, regional patterns
 and statement characteristics.
 """
 
-import json
+import argparse
 import csv
+import re
 import sys
 from pathlib import Path
-from collections import Counter
+from collections import Counter, defaultdict
+from functools import lru_cache
+
+import storage
+from storage import load_json
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
 
 def load_vote_data(json_path):
     """Load vote data from JSON file."""
-    with open(json_path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    return load_json(json_path)
+
+
+# Regional classifications based on UN regional groups
+_REGIONS = {
+    'Africa': [
+        'Algeria', 'Angola', 'Benin', 'Botswana', 'Burkina Faso', 'Burundi',
+        'Cameroon', 'Cape Verde', 'Central African Republic', 'Chad', 'Comoros',
+        'Congo', 'Cote Divoire', 'Democratic Republic Of Congo', 'Djibouti',
+        'Egypt', 'Equatorial Guinea', 'Eritrea', 'Eswatini', 'Ethiopia',
+        'Gabon', 'Gambia', 'Ghana', 'Guinea', 'Guinea Bissau', 'Kenya',
+        'Lesotho', 'Liberia', 'Libya', 'Madagascar', 'Malawi', 'Mali',
+        'Mauritania', 'Mauritius', 'Morocco', 'Mozambique', 'Namibia',
+        'Niger', 'Nigeria', 'Rwanda', 'Sao Tome And Principe', 'Senegal',
+        'Seychelles', 'Sierra Leone', 'Somalia', 'South Africa', 'South Sudan',
+        'Sudan', 'Tanzania', 'Togo', 'Tunisia', 'Uganda', 'Zambia', 'Zimbabwe'
+    ],
+    'Asia-Pacific': [
+        'Afghanistan', 'Australia', 'Bahrain', 'Bangladesh', 'Bhutan', 'Brunei',
+        'Cambodia', 'China', 'East Timor', 'Fiji', 'India', 'Indonesia', 'Iran',
+        'Iraq', 'Israel', 'Japan', 'Jordan', 'Kazakhstan', 'Kiribati', 'Kuwait',
+        'Kyrgyzstan', 'Laos', 'Lebanon', 'Malaysia', 'Maldives', 'Marshall Islands',
+        'Micronesia Country', 'Mongolia', 'Myanmar', 'Nauru', 'Nepal', 'New Zealand',
+        'North Korea', 'Oman', 'Pakistan', 'Palau', 'Palestine', 'Papua New Guinea',
+        'Philippines', 'Qatar', 'Samoa', 'Saudi Arabia', 'Singapore', 'Solomon Islands',
+        'South Korea', 'Sri Lanka', 'Syria', 'Tajikistan', 'Thailand', 'Tonga',
+        'Turkey', 'Turkmenistan', 'Tuvalu', 'United Arab Emirates', 'Uzbekistan',
+        'Vanuatu', 'Vietnam', 'Yemen'
+    ],
+    'Eastern Europe': [
+        'Albania', 'Armenia', 'Azerbaijan', 'Belarus', 'Bosnia And Herzegovina',
+        'Bulgaria', 'Croatia', 'Cyprus', 'Czechia', 'Estonia', 'Georgia',
+        'Hungary', 'Latvia', 'Lithuania', 'Moldova', 'Montenegro', 'North Macedonia',
+        'Poland', 'Romania', 'Russia', 'Serbia', 'Slovakia', 'Slovenia', 'Ukraine'
+    ],
+    'Latin America & Caribbean': [
+        'Antigua And Barbuda', 'Argentina', 'Bahamas', 'Barbados', 'Belize', 'Bolivia',
+        'Brazil', 'Chile', 'Colombia', 'Costa Rica', 'Cuba', 'Dominica',
+        'Dominican Republic', 'Ecuador', 'El Salvador', 'Grenada', 'Guatemala',
+        'Guyana', 'Haiti', 'Honduras', 'Jamaica', 'Mexico', 'Nicaragua', 'Panama',
+        'Paraguay', 'Peru', 'Saint Kitts And Nevis', 'Saint Lucia',
+        'Saint Vincent And The Grenadines', 'Suriname', 'Trinidad And Tobago',
+        'Uruguay', 'Venezuela'
+    ],
+    'Western Europe & Others': [
+        'Andorra', 'Austria', 'Belgium', 'Canada', 'Denmark', 'Finland', 'France',
+        'Germany', 'Greece', 'Holy See', 'Iceland', 'Ireland', 'Italy', 'Liechtenstein',
+        'Luxembourg', 'Malta', 'Monaco', 'Netherlands', 'Norway', 'Portugal',
+        'San Marino', 'Spain', 'Sweden', 'Switzerland', 'United Kingdom', 'United States'
+    ]
+}
+
+# Inverted once so classification is a single dict lookup
+_COUNTRY_TO_REGION = {
+    country: region for region, countries in _REGIONS.items() for country in countries
+}
 
 
 def classify_region(country):
     """Classify country into UN regional group."""
-    # Regional classifications based on UN regional groups
-    regions = {
-        'Africa': [
-            'Algeria', 'Angola', 'Benin', 'Botswana', 'Burkina Faso', 'Burundi',
-            'Cameroon', 'Cape Verde', 'Central African Republic', 'Chad', 'Comoros',
-            'Congo', 'Cote Divoire', 'Democratic Republic Of Congo', 'Djibouti',
-            'Egypt', 'Equatorial Guinea', 'Eritrea', 'Eswatini', 'Ethiopia',
-            'Gabon', 'Gambia', 'Ghana', 'Guinea', 'Guinea Bissau', 'Kenya',
-            'Lesotho', 'Liberia', 'Libya', 'Madagascar', 'Malawi', 'Mali',
-            'Mauritania', 'Mauritius', 'Morocco', 'Mozambique', 'Namibia',
-            'Niger', 'Nigeria', 'Rwanda', 'Sao Tome And Principe', 'Senegal',
-            'Seychelles', 'Sierra Leone', 'Somalia', 'South Africa', 'South Sudan',
-            'Sudan', 'Tanzania', 'Togo', 'Tunisia', 'Uganda', 'Zambia', 'Zimbabwe'
-        ],
-        'Asia-Pacific': [
-            'Afghanistan', 'Australia', 'Bahrain', 'Bangladesh', 'Bhutan', 'Brunei',
-            'Cambodia', 'China', 'East Timor', 'Fiji', 'India', 'Indonesia', 'Iran',
-            'Iraq', 'Israel', 'Japan', 'Jordan', 'Kazakhstan', 'Kiribati', 'Kuwait',
-            'Kyrgyzstan', 'Laos', 'Lebanon', 'Malaysia', 'Maldives', 'Marshall Islands',
-            'Micronesia Country', 'Mongolia', 'Myanmar', 'Nauru', 'Nepal', 'New Zealand',
-            'North Korea', 'Oman', 'Pakistan', 'Palau', 'Palestine', 'Papua New Guinea',
-            'Philippines', 'Qatar', 'Samoa', 'Saudi Arabia', 'Singapore', 'Solomon Islands',
-            'South Korea', 'Sri Lanka', 'Syria', 'Tajikistan', 'Thailand', 'Tonga',
-            'Turkey', 'Turkmenistan', 'Tuvalu', 'United Arab Emirates', 'Uzbekistan',
-            'Vanuatu', 'Vietnam', 'Yemen'
-        ],
-        'Eastern Europe': [
-            'Albania', 'Armenia', 'Azerbaijan', 'Belarus', 'Bosnia And Herzegovina',
-            'Bulgaria', 'Croatia', 'Cyprus', 'Czechia', 'Estonia', 'Georgia',
-            'Hungary', 'Latvia', 'Lithuania', 'Moldova', 'Montenegro', 'North Macedonia',
-            'Poland', 'Romania', 'Russia', 'Serbia', 'Slovakia', 'Slovenia', 'Ukraine'
-        ],
-        'Latin America & Caribbean': [
-            'Antigua And Barbuda', 'Argentina', 'Bahamas', 'Barbados', 'Belize', 'Bolivia',
-            'Brazil', 'Chile', 'Colombia', 'Costa Rica', 'Cuba', 'Dominica',
-            'Dominican Republic', 'Ecuador', 'El Salvador', 'Grenada', 'Guatemala',
-            'Guyana', 'Haiti', 'Honduras', 'Jamaica', 'Mexico', 'Nicaragua', 'Panama',
-            'Paraguay', 'Peru', 'Saint Kitts And Nevis', 'Saint Lucia',
-            'Saint Vincent And The Grenadines', 'Suriname', 'Trinidad And Tobago',
-            'Uruguay', 'Venezuela'
-        ],
-        'Western Europe & Others': [
-            'Andorra', 'Austria', 'Belgium', 'Canada', 'Denmark', 'Finland', 'France',
-            'Germany', 'Greece', 'Holy See', 'Iceland', 'Ireland', 'Italy', 'Liechtenstein',
-            'Luxembourg', 'Malta', 'Monaco', 'Netherlands', 'Norway', 'Portugal',
-            'San Marino', 'Spain', 'Sweden', 'Switzerland', 'United Kingdom', 'United States'
-        ]
-    }
-
-    for region, countries in regions.items():
-        if country in countries:
-            return region
-    return 'Other'
+    return _COUNTRY_TO_REGION.get(country, 'Other')
+
+
+# Simplified classification - in production, use World Bank data
+_HIGH_INCOME = frozenset([
+    'United States', 'Canada', 'United Kingdom', 'Germany', 'France', 'Japan',
+    'Australia', 'South Korea', 'Italy', 'Spain', 'Netherlands', 'Switzerland',
+    'Sweden', 'Norway', 'Denmark', 'Finland', 'Austria', 'Belgium', 'Ireland',
+    'Luxembourg', 'Singapore', 'New Zealand', 'Israel', 'United Arab Emirates',
+    'Qatar', 'Kuwait', 'Saudi Arabia', 'Bahrain', 'Oman', 'Iceland', 'Portugal',
+    'Greece', 'Slovenia', 'Czechia', 'Estonia', 'Slovakia', 'Lithuania', 'Latvia',
+    'Poland', 'Hungary', 'Croatia', 'Chile', 'Uruguay', 'Argentina', 'Trinidad And Tobago',
+    'Barbados', 'Antigua And Barbuda', 'Saint Kitts And Nevis', 'Seychelles', 'Palau'
+])
 
 
 def classify_income_group(country):
     """Classify country by World Bank income group (simplified)."""
-    # Simplified classification - in production, use World Bank data
-    high_income = [
-        'United States', 'Canada', 'United Kingdom', 'Germany', 'France', 'Japan',
-        'Australia', 'South Korea', 'Italy', 'Spain', 'Netherlands', 'Switzerland',
-        'Sweden', 'Norway', 'Denmark', 'Finland', 'Austria', 'Belgium', 'Ireland',
-        'Luxembourg', 'Singapore', 'New Zealand', 'Israel', 'United Arab Emirates',
-        'Qatar', 'Kuwait', 'Saudi Arabia', 'Bahrain', 'Oman', 'Iceland', 'Portugal',
-        'Greece', 'Slovenia', 'Czechia', 'Estonia', 'Slovakia', 'Lithuania', 'Latvia',
-        'Poland', 'Hungary', 'Croatia', 'Chile', 'Uruguay', 'Argentina', 'Trinidad And Tobago',
-        'Barbados', 'Antigua And Barbuda', 'Saint Kitts And Nevis', 'Seychelles', 'Palau'
-    ]
-
-    if country in high_income:
+    if country in _HIGH_INCOME:
         return 'High Income'
     else:
         return 'Low-Middle Income'
 
 
+# Major groupings
+
+_EU_MEMBERS = frozenset([
+    'Austria', 'Belgium', 'Bulgaria', 'Croatia', 'Cyprus', 'Czechia', 'Denmark',
+    'Estonia', 'Finland', 'France', 'Germany', 'Greece', 'Hungary', 'Ireland',
+    'Italy', 'Latvia', 'Lithuania', 'Luxembourg', 'Malta', 'Netherlands', 'Poland',
+    'Portugal', 'Romania', 'Slovakia', 'Slovenia', 'Spain', 'Sweden'
+])
+
+_NATO_MEMBERS = frozenset([
+    'Albania', 'Belgium', 'Bulgaria', 'Canada', 'Croatia', 'Czechia', 'Denmark',
+    'Estonia', 'Finland', 'France', 'Germany', 'Greece', 'Hungary', 'Iceland',
+    'Italy', 'Latvia', 'Lithuania', 'Luxembourg', 'Montenegro', 'Netherlands',
+    'North Macedonia', 'Norway', 'Poland', 'Portugal', 'Romania', 'Slovakia',
+    'Slovenia', 'Spain', 'Turkey', 'United Kingdom', 'United States'
+])
+
+_OIC_MEMBERS = frozenset([
+    'Afghanistan', 'Albania', 'Algeria', 'Azerbaijan', 'Bahrain', 'Bangladesh',
+    'Benin', 'Brunei', 'Burkina Faso', 'Cameroon', 'Chad', 'Comoros',
+    'Cote Divoire', 'Djibouti', 'Egypt', 'Gabon', 'Gambia', 'Guinea',
+    'Guinea Bissau', 'Guyana', 'Indonesia', 'Iran', 'Iraq', 'Jordan',
+    'Kazakhstan', 'Kuwait', 'Kyrgyzstan', 'Lebanon', 'Libya', 'Malaysia',
+    'Maldives', 'Mali', 'Mauritania', 'Morocco', 'Mozambique', 'Niger',
+    'Nigeria', 'Oman', 'Pakistan', 'Palestine', 'Qatar', 'Saudi Arabia',
+    'Senegal', 'Sierra Leone', 'Somalia', 'Sudan', 'Suriname', 'Syria',
+    'Tajikistan', 'Togo', 'Tunisia', 'Turkey', 'Turkmenistan', 'Uganda',
+    'United Arab Emirates', 'Uzbekistan', 'Yemen'
+])
+
+_ARAB_LEAGUE = frozenset([
+    'Algeria', 'Bahrain', 'Comoros', 'Djibouti', 'Egypt', 'Iraq', 'Jordan',
+    'Kuwait', 'Lebanon', 'Libya', 'Mauritania', 'Morocco', 'Oman', 'Palestine',
+    'Qatar', 'Saudi Arabia', 'Somalia', 'Sudan', 'Syria', 'Tunisia',
+    'United Arab Emirates', 'Yemen'
+])
+
+
+# Membership columns, in the order check_membership returns them
+_MEMBERSHIP_FIELDS = ('EU', 'NATO', 'OIC', 'Arab_League')
+
+
+@lru_cache(maxsize=None)
 def check_membership(country):
-    """Check various organizational memberships."""
-    # Major groupings
-    eu_members = [
-        'Austria', 'Belgium', 'Bulgaria', 'Croatia', 'Cyprus', 'Czechia', 'Denmark',
-        'Estonia', 'Finland', 'France', 'Germany', 'Greece', 'Hungary', 'Ireland',
-        'Italy', 'Latvia', 'Lithuania', 'Luxembourg', 'Malta', 'Netherlands', 'Poland',
-        'Portugal', 'Romania', 'Slovakia', 'Slovenia', 'Spain', 'Sweden'
-    ]
-
-    nato_members = [
-        'Albania', 'Belgium', 'Bulgaria', 'Canada', 'Croatia', 'Czechia', 'Denmark',
-        'Estonia', 'Finland', 'France', 'Germany', 'Greece', 'Hungary', 'Iceland',
-        'Italy', 'Latvia', 'Lithuania', 'Luxembourg', 'Montenegro', 'Netherlands',
-        'North Macedonia', 'Norway', 'Poland', 'Portugal', 'Romania', 'Slovakia',
-        'Slovenia', 'Spain', 'Turkey', 'United Kingdom', 'United States'
-    ]
-
-    oic_members = [
-        'Afghanistan', 'Albania', 'Algeria', 'Azerbaijan', 'Bahrain', 'Bangladesh',
-        'Benin', 'Brunei', 'Burkina Faso', 'Cameroon', 'Chad', 'Comoros',
-        'Cote Divoire', 'Djibouti', 'Egypt', 'Gabon', 'Gambia', 'Guinea',
-        'Guinea Bissau', 'Guyana', 'Indonesia', 'Iran', 'Iraq', 'Jordan',
-        'Kazakhstan', 'Kuwait', 'Kyrgyzstan', 'Lebanon', 'Libya', 'Malaysia',
-        'Maldives', 'Mali', 'Mauritania', 'Morocco', 'Mozambique', 'Niger',
-        'Nigeria', 'Oman', 'Pakistan', 'Palestine', 'Qatar', 'Saudi Arabia',
-        'Senegal', 'Sierra Leone', 'Somalia', 'Sudan', 'Suriname', 'Syria',
-        'Tajikistan', 'Togo', 'Tunisia', 'Turkey', 'Turkmenistan', 'Uganda',
-        'United Arab Emirates', 'Uzbekistan', 'Yemen'
-    ]
-
-    arab_league = [
-        'Algeria', 'Bahrain', 'Comoros', 'Djibouti', 'Egypt', 'Iraq', 'Jordan',
-        'Kuwait', 'Lebanon', 'Libya', 'Mauritania', 'Morocco', 'Oman', 'Palestine',
-        'Qatar', 'Saudi Arabia', 'Somalia', 'Sudan', 'Syria', 'Tunisia',
-        'United Arab Emirates', 'Yemen'
-    ]
-
-    return {
-        'EU': country in eu_members,
-        'NATO': country in nato_members,
-        'OIC': country in oic_members,
-        'Arab_League': country in arab_league
-    }
+    """Check various organizational memberships, in _MEMBERSHIP_FIELDS order."""
+    return (
+        country in _EU_MEMBERS,
+        country in _NATO_MEMBERS,
+        country in _OIC_MEMBERS,
+        country in _ARAB_LEAGUE
+    )
+
+
+# Statement themes and the phrases that signal them
+_THEMES = {
+    'humanitarian': ('humanitarian',),
+    'two_state': ('two-state', 'two state'),
+    'accountability': ('accountabil',),
+    'international_law': ('international law', 'international humanitarian law'),
+    'civilian': ('civilian',),
+    'reconstruction': ('reconstruction', 'rebuilding'),
+    'security': ('security',),
+    'hamas': ('hamas',),
+    'occupation': ('occupation', 'occupied'),
+    'blockade': ('blockade', 'restrictions'),
+}
+_THEME_INDEX = {name: i for i, name in enumerate(_THEMES)}
+
+# Statement analysis columns, in the order analyze_statement returns them
+_ANALYSIS_FIELDS = (*('mentions_' + name for name in _THEMES), 'statement_length')
+
+# Analysis columns are left blank when there is no statement
+_NO_ANALYSIS = ('',) * len(_ANALYSIS_FIELDS)
+
+# Statements shorter than every theme phrase can't mention any of them
+_SHORTEST_PHRASE = min(len(phrase) for phrases in _THEMES.values() for phrase in phrases)
+_NO_MENTIONS = (False,) * len(_THEMES)
+
+# Fallback single-pass scanner. The alternation sits inside a lookahead so
+# matches don't consume text: overlapping phrases (e.g. "international
+# humanitarian law" also mentioning "humanitarian") are all seen.
+_THEME_SCANNER = re.compile(
+    '(?=' + '|'.join(
+        f"(?P<{name}>{'|'.join(map(re.escape, phrases))})"
+        for name, phrases in _THEMES.items()
+    ) + ')',
+    re.IGNORECASE
+)
+
+
+def _build_theme_automaton():
+    """Compile the theme phrases into an Aho-Corasick automaton (None without pyahocorasick)."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for name, phrases in _THEMES.items():
+        for phrase in phrases:
+            automaton.add_word(phrase, _THEME_INDEX[name])
+    automaton.make_automaton()
+    return automaton
+
+
+_THEME_AUTOMATON = _build_theme_automaton()
 
 
 def analyze_statement(statement):
-    """Analyze statement for key themes."""
+    """Analyze statement for key themes, in _ANALYSIS_FIELDS order."""
     if not statement:
-        return {}
+        return _NO_ANALYSIS
+    if len(statement) < _SHORTEST_PHRASE:
+        return (*_NO_MENTIONS, len(statement.split()))
+
+    mentions = [False] * len(_THEMES)
+    if _THEME_AUTOMATON is not None:
+        for _, index in _THEME_AUTOMATON.iter(statement.lower()):
+            mentions[index] = True
+    else:
+        for match in _THEME_SCANNER.finditer(statement):
+            mentions[_THEME_INDEX[match.lastgroup]] = True
+    return (*mentions, len(statement.split()))
+
 
-    statement_lower = statement.lower()
+# Write buffer for the output CSV, so the file goes out in a few large writes
+CSV_BUFFER_SIZE = 1 << 20
 
-    return {
-        'mentions_humanitarian': 'humanitarian' in statement_lower,
-        'mentions_two_state': 'two-state' in statement_lower or 'two state' in statement_lower,
-        'mentions_accountability': 'accountabil' in statement_lower,
-        'mentions_international_law': 'international law' in statement_lower or 'international humanitarian law' in statement_lower,
-        'mentions_civilian': 'civilian' in statement_lower,
-        'mentions_reconstruction': 'reconstruction' in statement_lower or 'rebuilding' in statement_lower,
-        'mentions_security': 'security' in statement_lower,
-        'mentions_hamas': 'hamas' in statement_lower,
-        'mentions_occupation': 'occupation' in statement_lower or 'occupied' in statement_lower,
-        'mentions_blockade': 'blockade' in statement_lower or 'restrictions' in statement_lower,
-        'statement_length': len(statement.split())
-    }
+# CSV columns
+_FIELDS = (
+    'Country', 'Country_Slug', 'Vote', 'Region', 'Income_Group',
+    *_MEMBERSHIP_FIELDS,
+    *_ANALYSIS_FIELDS,
+    'Statement'
+)
 
 
 def generate_analysis_csv(json_path, csv_path):
     """Generate detailed CSV analysis from vote JSON."""
     data = load_vote_data(json_path)
 
-    # Prepare rows
-    rows = []
-    for vote_record in data['votes']:
-        country = vote_record['country']
-        vote = vote_record['vote']
-        statement = vote_record['statement']
-
-        # Base data
-        row = {
-            'Country': country,
-            'Country_Slug': vote_record['country_slug'],
-            'Vote': vote,
-            'Region': classify_region(country),
-            'Income_Group': classify_income_group(country),
-        }
-
-        # Add membership data
-        memberships = check_membership(country)
-        row.update(memberships)
-
-        # Add statement analysis
-        statement_analysis = analyze_statement(statement)
-        row.update(statement_analysis)
-
-        # Add statement text (last to keep it at end of CSV)
-        row['Statement'] = statement
-
-        rows.append(row)
-
-    # Write CSV
-    fieldnames = [
-        'Country', 'Country_Slug', 'Vote', 'Region', 'Income_Group',
-        'EU', 'NATO', 'OIC', 'Arab_League',
-        'mentions_humanitarian', 'mentions_two_state', 'mentions_accountability',
-        'mentions_international_law', 'mentions_civilian', 'mentions_reconstruction',
-        'mentions_security', 'mentions_hamas', 'mentions_occupation', 'mentions_blockade',
-        'statement_length', 'Statement'
-    ]
-
-    with open(csv_path, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(rows)
+    # Rows are written as they're built; the summary is tallied alongside
+    vote_counts = Counter()
+    regions = defaultdict(Counter)
+
+    with open(csv_path, 'w', newline='', encoding='utf-8', buffering=CSV_BUFFER_SIZE) as f:
+        writer = csv.writer(f)
+        writer.writerow(_FIELDS)
+
+        for vote_record in data['votes']:
+            country = vote_record['country']
+            vote = vote_record['vote']
+            statement = vote_record['statement']
+            region = classify_region(country)
+
+            # Columns in _FIELDS order, statement text last
+            writer.writerow((
+                country,
+                vote_record['country_slug'],
+                vote,
+                region,
+                classify_income_group(country),
+                *check_membership(country),
+                *analyze_statement(statement),
+                statement
+            ))
+
+            vote_counts[vote] += 1
+            regions[region][vote] += 1
 
     print(f"✓ Generated CSV analysis: {csv_path}")
-    print(f"  Total votes: {len(rows)}")
+    print(f"  Total votes: {sum(vote_counts.values())}")
 
     # Print summary statistics
-    vote_counts = Counter(row['Vote'] for row in rows)
     print(f"\nVote Summary:")
     print(f"  YES: {vote_counts['yes']}")
     print(f"  NO: {vote_counts['no']}")
@@ -225,26 +288,48 @@ def generate_analysis_csv(json_path, csv_path):
 
     # Regional breakdown
     print(f"\nRegional Breakdown:")
-    regions = {}
-    for row in rows:
-        region = row['Region']
-        vote = row['Vote']
-        if region not in regions:
-            regions[region] = {'yes': 0, 'no': 0, 'abstain': 0}
-        regions[region][vote] += 1
-
     for region, counts in sorted(regions.items()):
         total = sum(counts.values())
         print(f"  {region}: {counts['yes']} yes, {counts['no']} no, {counts['abstain']} abstain ({total} total)")
 
 
+def _missing_accelerators():
+    """Names of the optional C-accelerated packages that aren't installed."""
+    missing = []
+    if storage.orjson is None:
+        missing.append('orjson')
+    if ahocorasick is None:
+        missing.append('pyahocorasick')
+    return missing
+
+
 def main():
     """Main entry point."""
-    if len(sys.argv) > 1:
-        json_path = sys.argv[1]
-    else:
+    parser = argparse.ArgumentParser(
+        description="Generate CSV analysis from UN vote simulation results"
+    )
+    parser.add_argument(
+        'json_path',
+        nargs='?',
         # Default to latest results
-        json_path = 'tasks/reactions/01_gaza_ceasefire_resolution_latest.json'
+        default='tasks/reactions/01_gaza_ceasefire_resolution_latest.json',
+        help="Vote results JSON (default: latest Gaza ceasefire results)"
+    )
+    parser.add_argument(
+        '--fast',
+        action='store_true',
+        help="Require the C-accelerated parsing and keyword scanning (orjson, pyahocorasick) "
+             "instead of silently falling back to the pure-Python paths"
+    )
+    args = parser.parse_args()
+
+    if args.fast:
+        missing = _missing_accelerators()
+        if missing:
+            print(f"Error: --fast needs {', '.join(missing)}. Run: pip install {' '.join(missing)}")
+            sys.exit(1)
+
+    json_path = args.json_path
 
     # Determine output path
     json_file = Path(json_path)
@@ -0,0 +1,17 @@
+"""
+Shared helpers for the report generators
+
+Grouping and ordering logic used by the PDF report scripts, so every report
+presents the bilateral impact analyses the same way.
+"""
+
+from collections import defaultdict
+from typing import Dict, Iterable, List
+
+
+def group_by_category(analyses: Iterable[Dict]) -> Dict[str, List[Dict]]:
+    """Group bilateral impact analyses by impact category, preserving order"""
+    by_category = defaultdict(list)
+    for analysis in analyses:
+        by_category[analysis['impact_analysis']['impact_category']].append(analysis)
+    return by_category
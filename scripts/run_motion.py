@@ -7,37 +7,268 @@ vote on resolutions and provide statements explaining their positions.
 
 Usage:
     python scripts/run_motion.py <motion_id> [--provider cloud|local] [--model MODEL_NAME]
+                                 [--checkpoint-every N]
 
 Example:
     python scripts/run_motion.py 01_gaza_ceasefire_resolution --provider cloud
 """
 
 import argparse
+import asyncio
 import json
 import os
 import sys
-from datetime import datetime
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
-import re
+from typing import Callable, Dict, List, Optional
 
 # Add project root to path
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
+from storage import ResponseCache, dump_json, dumps_line, link_latest, loads
+
+# Provider SDKs are optional at import time; the runner reports a missing
+# package when it is constructed for a provider that needs it
+try:
+    import anthropic
+except ImportError:
+    anthropic = None
+
+try:
+    import openai
+except ImportError:
+    openai = None
+
+try:
+    import ollama
+except ImportError:
+    ollama = None
+
+# Installed with any of the provider SDKs; used to size connection pools
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# Optional: lets the cloud connection pool use HTTP/2
+try:
+    import h2
+except ImportError:
+    h2 = None
+
+# Optional: faster event loop for the concurrent fan-out (asyncio's is used when absent)
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+
+def _utc_timestamp() -> str:
+    """Current UTC time as ISO 8601 with a Z suffix (the results' timestamp format)"""
+    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+class AsyncRateLimiter:
+    """
+    Token-bucket limiter for requests/min and tokens/min
+
+    Both buckets refill continuously at their per-minute rate and hold at most
+    one minute of capacity, so requests go out at the provider's ceiling
+    instead of bursting into 429s and backing off.
+    """
+
+    def __init__(self, rpm: Optional[float] = None, tpm: Optional[float] = None):
+        """
+        Initialize the limiter
+
+        Args:
+            rpm: Requests per minute (None or 0 disables the request bucket)
+            tpm: Tokens per minute (None or 0 disables the token bucket)
+        """
+        self.rpm = rpm or None
+        self.tpm = tpm or None
+        self.available_request_capacity = float(self.rpm or 0)
+        self.available_token_capacity = float(self.tpm or 0)
+        self.last_update_time = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.rpm is not None or self.tpm is not None
+
+    def _refill(self):
+        now = time.monotonic()
+        elapsed = now - self.last_update_time
+        self.last_update_time = now
+        if self.rpm:
+            self.available_request_capacity = min(
+                self.rpm, self.available_request_capacity + elapsed * self.rpm / 60
+            )
+        if self.tpm:
+            self.available_token_capacity = min(
+                self.tpm, self.available_token_capacity + elapsed * self.tpm / 60
+            )
+
+    async def acquire(self, estimated_tokens: int):
+        """Wait until one request of estimated_tokens fits in both buckets, then take it"""
+        if not self.enabled:
+            return
+
+        # Never wait for more tokens than the bucket can ever hold
+        if self.tpm:
+            estimated_tokens = min(estimated_tokens, self.tpm)
+
+        # Callers queue on the lock, so capacity is handed out in arrival order
+        async with self._lock:
+            while True:
+                self._refill()
+                wait = 0.0
+                if self.rpm and self.available_request_capacity < 1:
+                    wait = (1 - self.available_request_capacity) * 60 / self.rpm
+                if self.tpm and self.available_token_capacity < estimated_tokens:
+                    wait = max(wait, (estimated_tokens - self.available_token_capacity) * 60 / self.tpm)
+                if wait <= 0:
+                    break
+                await asyncio.sleep(wait)
+
+            if self.rpm:
+                self.available_request_capacity -= 1
+            if self.tpm:
+                self.available_token_capacity -= estimated_tokens
+
+
+class _JsonObjectScanner:
+    """
+    Incrementally finds the end of the first JSON object in streamed text
+
+    Text before the first opening brace is skipped, and braces inside strings
+    are ignored.
+    """
+
+    def __init__(self):
+        self.depth = 0
+        self.in_string = False
+        self.escaped = False
+
+    def feed(self, text: str) -> Optional[int]:
+        """Consume more text; returns the index in text of the closing brace once the object has closed"""
+        for index, char in enumerate(text):
+            if self.depth == 0:
+                if char == "{":
+                    self.depth = 1
+            elif self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif char == "\\":
+                    self.escaped = True
+                elif char == '"':
+                    self.in_string = False
+            elif char == '"':
+                self.in_string = True
+            elif char == "{":
+                self.depth += 1
+            elif char == "}":
+                self.depth -= 1
+                if self.depth == 0:
+                    return index
+        return None
+
 
 class MotionRunner:
     """Runs UN motion simulations with AI agents"""
 
     VALID_VOTES = ["yes", "no", "abstain"]
 
-    def __init__(self, provider: str = "cloud", model: Optional[str] = None):
+    VOTE_EMOJI = {"yes": "✅", "no": "❌", "abstain": "⚪"}
+
+    # Default number of in-flight model requests (keep under the account's RPM limit)
+    DEFAULT_CONCURRENCY = 16
+
+    # Output token budget and sampling temperature per vote
+    MAX_TOKENS = 800
+    TEMPERATURE = 0.7
+
+    # JSON Schema every vote must match (OpenAI structured outputs, Anthropic tool input)
+    VOTE_SCHEMA = {
+        "type": "object",
+        "properties": {
+            "vote": {"type": "string", "enum": VALID_VOTES},
+            "statement": {"type": "string"}
+        },
+        "required": ["vote", "statement"],
+        "additionalProperties": False
+    }
+
+    # Forced tool call used to get schema-shaped votes back from Anthropic models
+    RECORD_VOTE_TOOL = {
+        "name": "record_vote",
+        "description": "Record the country's vote and statement on the resolution.",
+        "input_schema": VOTE_SCHEMA
+    }
+
+    # Shared prefix of every agent query for a motion: the resolution and the
+    # response format. Nothing country-specific may go in here, or the
+    # provider-side prompt cache stops matching across countries.
+    MOTION_PROMPT_TEMPLATE = """You are voting on the following UN General Assembly resolution:
+
+{motion_text}
+
+You must respond with a JSON object containing:
+1. "vote": Your vote - must be exactly one of: "yes", "no", or "abstain"
+2. "statement": A brief statement (2-4 sentences) explaining your country's position
+
+Your response must be valid JSON in this exact format:
+{{
+  "vote": "yes",
+  "statement": "Your explanation here."
+}}"""
+
+    # Per-country instructions, sent after the shared prefix
+    COUNTRY_PROMPT_TEMPLATE = """Cast your vote as {country}.
+
+IMPORTANT: Your statement must articulate {country}'s UNIQUE perspective, national interests, and specific reasons for this vote. Reference your country's:
+- Historical positions on this issue
+- Regional concerns and alliances
+- Domestic political considerations
+- Specific clauses in the resolution that align with or contradict your interests
+
+Avoid generic diplomatic language. Be specific to {country}'s situation and worldview.
+
+Respond with the JSON object only."""
+
+    # Cloud API connection pool size (covers any sensible --concurrency)
+    CLOUD_MAX_CONNECTIONS = 128
+
+    # Ollama connection pool size and per-request timeout (seconds)
+    LOCAL_MAX_CONNECTIONS = 64
+    LOCAL_TIMEOUT = 300
+
+    # Responses longer than this (chars) are parsed off the event loop
+    PARSE_OFFLOAD_THRESHOLD = 2048
+
+    # Seconds between batch API status checks
+    BATCH_POLL_INTERVAL = 60
+
+    # SDK retries (exponential backoff, honoring Retry-After) on connection
+    # errors, timeouts, 429s and 5xx; each attempt is bounded by REQUEST_TIMEOUT
+    # seconds instead of the SDKs' 10-minute default
+    MAX_RETRIES = 5
+    REQUEST_TIMEOUT = 60
+
+    def __init__(self, provider: str = "cloud", model: Optional[str] = None,
+                 use_cache: bool = True, cache_dir: Optional[Path] = None):
         """
         Initialize the motion runner
 
         Args:
             provider: Either 'cloud' (API) or 'local' (local model)
             model: Model name/identifier (optional, uses defaults if not specified)
+            use_cache: Reuse previously cached responses for identical prompts
+            cache_dir: Where cached responses are kept (default: .cache/motions)
         """
         self.provider = provider
         self.model = model
@@ -45,6 +276,11 @@ class MotionRunner:
         self.agents_dir = self.project_root / "agents" / "representatives"
         self.motions_dir = self.project_root / "tasks" / "motions"
         self.results_dir = self.project_root / "tasks" / "reactions"
+        # Cleared if the OpenAI-compatible endpoint rejects response_format
+        self.structured_output = True
+        self.cache = None
+        if use_cache:
+            self.cache = ResponseCache(cache_dir or self.project_root / ".cache" / "motions")
 
         # Load configuration
         self._load_config()
@@ -66,63 +302,148 @@ class MotionRunner:
 
             # Determine which API to use based on model name
             self.use_anthropic = self.model.startswith("claude")
+
+            # Optional account rate limits, enforced client-side
+            self.rate_limiter = AsyncRateLimiter(
+                rpm=float(os.getenv("API_RPM") or 0),
+                tpm=float(os.getenv("API_TPM") or 0)
+            )
         else:
             # Local model configuration
             self.local_model_path = os.getenv("LOCAL_MODEL_PATH")
             if not self.model:
                 self.model = os.getenv("LOCAL_MODEL_NAME", "llama3")
             self.use_anthropic = False
+            self.rate_limiter = AsyncRateLimiter()
 
     def _init_ai_client(self):
-        """Initialize the appropriate AI client"""
+        """Initialize the appropriate async AI client"""
         if self.provider == "cloud":
             if self.use_anthropic:
-                try:
-                    import anthropic
-                    self.client = anthropic.Anthropic(api_key=self.anthropic_api_key)
-                    print(f"✓ Initialized Anthropic API client (model: {self.model})")
-                except ImportError:
+                if anthropic is None:
                     print("Error: anthropic package not installed. Run: pip install anthropic")
                     sys.exit(1)
+                self.aclient = anthropic.AsyncAnthropic(
+                    api_key=self.anthropic_api_key,
+                    max_retries=self.MAX_RETRIES,
+                    timeout=self.REQUEST_TIMEOUT,
+                    **self._http_client_options()
+                )
+                print(f"✓ Initialized Anthropic API client (model: {self.model})")
             else:
-                try:
-                    # OpenAI or OpenRouter
-                    import openai
-                    if self.api_base:
-                        self.client = openai.OpenAI(
-                            api_key=self.openai_api_key,
-                            base_url=self.api_base
-                        )
-                    else:
-                        self.client = openai.OpenAI(api_key=self.openai_api_key)
-                    print(f"✓ Initialized OpenAI API client (model: {self.model})")
-                except ImportError:
+                if openai is None:
                     print("Error: openai package not installed. Run: pip install openai")
                     sys.exit(1)
+                # OpenAI or OpenRouter
+                client_options = self._http_client_options()
+                if self.api_base:
+                    client_options["base_url"] = self.api_base
+                self.aclient = openai.AsyncOpenAI(
+                    api_key=self.openai_api_key,
+                    max_retries=self.MAX_RETRIES,
+                    timeout=self.REQUEST_TIMEOUT,
+                    **client_options
+                )
+                print(f"✓ Initialized OpenAI API client (model: {self.model})")
         else:
-            try:
-                # Use Ollama for local models
-                import ollama
-                self.client = ollama
-                print(f"✓ Initialized local model client (model: {self.model})")
-            except ImportError:
+            if ollama is None:
                 print("Error: ollama package not installed. Run: pip install ollama")
                 sys.exit(1)
+            # Use Ollama for local models. Keep a connection alive for every
+            # in-flight request so concurrent queries don't reconnect; local
+            # generation can be slow, so allow long reads.
+            client_options = {}
+            if httpx is not None:
+                client_options = {
+                    "timeout": httpx.Timeout(self.LOCAL_TIMEOUT, connect=10.0),
+                    "limits": httpx.Limits(
+                        max_connections=self.LOCAL_MAX_CONNECTIONS,
+                        max_keepalive_connections=self.LOCAL_MAX_CONNECTIONS
+                    )
+                }
+            self.aclient = ollama.AsyncClient(**client_options)
+            print(f"✓ Initialized local model client (model: {self.model})")
+
+    def _http_client_options(self) -> Dict:
+        """
+        Shared connection pool for a cloud SDK client
+
+        The SDK defaults keep only 20 idle connections, so a wide fan-out
+        would reconnect (a new TLS handshake) mid-run. The pool here keeps a
+        connection for every in-flight request and uses HTTP/2 when the h2
+        package is installed.
+        """
+        if httpx is None:
+            return {}
+        return {
+            "http_client": httpx.AsyncClient(
+                http2=h2 is not None,
+                timeout=httpx.Timeout(self.REQUEST_TIMEOUT, connect=10.0),
+                limits=httpx.Limits(
+                    max_connections=self.CLOUD_MAX_CONNECTIONS,
+                    max_keepalive_connections=self.CLOUD_MAX_CONNECTIONS
+                )
+            )
+        }
+
+    async def aclose(self):
+        """Close the AI client and its connection pool"""
+        close = getattr(self.aclient, "close", None)
+        if close is not None:
+            await close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    @cached_property
+    def countries(self) -> List[Dict[str, str]]:
+        """
+        All countries with agents, scanned once per runner
+
+        os.scandir reports entry types without a stat per directory, and each
+        system prompt is read here, on a thread pool (a missing file is
+        skipped), rather than checked for existence first and read again per
+        query.
+        """
+        with os.scandir(self.agents_dir) as it:
+            entries = sorted(
+                (entry for entry in it if entry.is_dir(follow_symlinks=False)),
+                key=lambda entry: entry.name
+            )
+
+        prompt_paths = [os.path.join(entry.path, "system-prompt.md") for entry in entries]
+        if not prompt_paths:
+            return []
+
+        # Reads are independent per country, so overlap their filesystem latency
+        with ThreadPoolExecutor(max_workers=min(32, len(prompt_paths))) as executor:
+            prompts = list(executor.map(self._read_agent_prompt, prompt_paths))
+
+        return [
+            {
+                "name": entry.name.replace("-", " ").title(),
+                "slug": entry.name,
+                "prompt_path": prompt_path,
+                "system_prompt": system_prompt
+            }
+            for entry, prompt_path, system_prompt in zip(entries, prompt_paths, prompts)
+            if system_prompt is not None
+        ]
+
+    @classmethod
+    def _read_agent_prompt(cls, prompt_path: str) -> Optional[str]:
+        """Load an agent system prompt, or None if the country has none"""
+        try:
+            return cls.load_agent_prompt(prompt_path)
+        except FileNotFoundError:
+            return None
 
     def get_country_list(self) -> List[Dict[str, str]]:
         """Get list of all countries with agents"""
-        countries = []
-        for country_dir in sorted(self.agents_dir.iterdir()):
-            if country_dir.is_dir():
-                system_prompt_path = country_dir / "system-prompt.md"
-                if system_prompt_path.exists():
-                    country_name = country_dir.name.replace("-", " ").title()
-                    countries.append({
-                        "name": country_name,
-                        "slug": country_dir.name,
-                        "prompt_path": str(system_prompt_path)
-                    })
-        return countries
+        return list(self.countries)
 
     def load_motion(self, motion_id: str) -> Dict:
         """Load motion text from file"""
@@ -136,124 +457,631 @@ class MotionRunner:
         return {
             "id": motion_id,
             "text": motion_text,
-            "path": str(motion_path)
+            "path": str(motion_path),
+            # Formatted once here and shared by every country's request
+            "prompt": self.MOTION_PROMPT_TEMPLATE.format(motion_text=motion_text)
         }
 
-    def load_agent_prompt(self, prompt_path: str) -> str:
-        """Load agent system prompt"""
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def load_agent_prompt(prompt_path: str) -> str:
+        """Load agent system prompt (read once per path and kept for the process)"""
         with open(prompt_path, 'r', encoding='utf-8') as f:
             return f.read()
 
-    def query_agent(self, country: Dict, motion: Dict) -> Dict:
+    def build_motion_prompt(self, motion: Dict) -> str:
+        """Return the country-independent motion block shared by every agent query"""
+        if "prompt" in motion:
+            return motion["prompt"]
+        return self.MOTION_PROMPT_TEMPLATE.format(motion_text=motion['text'])
+
+    def _build_request(self, country: Dict, motion: Dict) -> Dict:
         """
-        Query an AI agent for their vote and statement
+        Build the provider-specific create() arguments for one country's vote
 
-        Returns:
-            Dict with 'vote' (yes/no/abstain) and 'statement' (brief explanation)
+        The motion block comes first and is identical for every country, so
+        providers with prompt caching only prefill it once per motion.
         """
-        system_prompt = self.load_agent_prompt(country['prompt_path'])
+        motion_prompt = self.build_motion_prompt(motion)
+        system_prompt = country['system_prompt']
+        user_prompt = self.COUNTRY_PROMPT_TEMPLATE.format(country=country['name'])
 
-        user_prompt = f"""You are voting on the following UN General Assembly resolution:
+        if self.use_anthropic:
+            return {
+                "model": self.model,
+                "max_tokens": self.MAX_TOKENS,
+                "system": [
+                    {"type": "text", "text": motion_prompt,
+                     "cache_control": {"type": "ephemeral"}},
+                    {"type": "text", "text": system_prompt}
+                ],
+                "messages": [
+                    {"role": "user", "content": user_prompt}
+                ],
+                "tools": [self.RECORD_VOTE_TOOL],
+                "tool_choice": {"type": "tool", "name": self.RECORD_VOTE_TOOL["name"]},
+                "temperature": self.TEMPERATURE
+            }
 
-{motion['text']}
+        request = {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": motion_prompt},
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt}
+            ]
+        }
+        if self.provider == "cloud":
+            # OpenAI API (caches matching prompt prefixes automatically)
+            request["temperature"] = self.TEMPERATURE
+            request["max_tokens"] = self.MAX_TOKENS
+            if self.structured_output:
+                request["response_format"] = {
+                    "type": "json_schema",
+                    "json_schema": {"name": "vote", "strict": True, "schema": self.VOTE_SCHEMA}
+                }
+        else:
+            # Ollama: one complete JSON reply rather than streamed chunks
+            request["stream"] = False
+            request["format"] = "json"
+        return request
+
+    def _estimate_tokens(self, request: Dict) -> int:
+        """Rough 4-chars-per-token estimate of a request plus its full output budget"""
+        chars = sum(len(block["text"]) for block in request.get("system", ()))
+        chars += sum(len(message["content"]) for message in request["messages"])
+        return chars // 4 + self.MAX_TOKENS
+
+    def _cache_key(self, request: Dict) -> str:
+        """
+        Response cache key for a request (covers model, sampling and prompts)
 
-You must respond with a JSON object containing:
-1. "vote": Your vote - must be exactly one of: "yes", "no", or "abstain"
-2. "statement": A brief statement (2-4 sentences) explaining your country's position
+        response_format is left out: it may be dropped mid-run for models
+        without structured outputs, and the cached vote is the same either way.
+        """
+        request = {key: value for key, value in request.items() if key != "response_format"}
+        return ResponseCache.make_key({"provider": self.provider, "request": request})
 
-IMPORTANT: Your statement must articulate {country['name']}'s UNIQUE perspective, national interests, and specific reasons for this vote. Reference your country's:
-- Historical positions on this issue
-- Regional concerns and alliances
-- Domestic political considerations
-- Specific clauses in the resolution that align with or contradict your interests
+    @staticmethod
+    def _error_result(statement: str, error: str) -> Dict:
+        """Abstain-with-error result recorded when a vote cannot be obtained"""
+        return {
+            "vote": "abstain",
+            "statement": statement,
+            "error": error
+        }
 
-Avoid generic diplomatic language. Be specific to {country['name']}'s situation and worldview.
+    async def query_agent(self, country: Dict, motion: Dict) -> Dict:
+        """
+        Query an AI agent for their vote and statement
 
-Your response must be valid JSON in this exact format:
-{{
-  "vote": "yes",
-  "statement": "Your explanation here."
-}}"""
+        Returns:
+            Dict with 'vote' (yes/no/abstain) and 'statement' (brief explanation)
+        """
+        request = self._build_request(country, motion)
 
+        # Reuse the vote from an earlier run with exactly the same request
+        cache_key = None
+        if self.cache is not None:
+            cache_key = self._cache_key(request)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        content = ""
         try:
             if self.provider == "cloud":
+                await self.rate_limiter.acquire(self._estimate_tokens(request))
                 if self.use_anthropic:
-                    # Anthropic API
-                    response = self.client.messages.create(
-                        model=self.model,
-                        max_tokens=800,
-                        system=system_prompt,
-                        messages=[
-                            {"role": "user", "content": user_prompt}
-                        ],
-                        temperature=0.7
-                    )
-                    content = response.content[0].text
+                    response = await self.aclient.messages.create(**request)
+                    result = self._tool_input(response)
                 else:
-                    # OpenAI API
-                    response = self.client.chat.completions.create(
-                        model=self.model,
-                        messages=[
-                            {"role": "system", "content": system_prompt},
-                            {"role": "user", "content": user_prompt}
-                        ],
-                        temperature=0.7,
-                        max_tokens=800
-                    )
-                    content = response.choices[0].message.content
+                    content = await self._create_chat_completion(request)
+                    result = await self._parse_vote_async(content)
             else:
-                response = self.client.chat(
-                    model=self.model,
-                    messages=[
-                        {"role": "system", "content": system_prompt},
-                        {"role": "user", "content": user_prompt}
-                    ]
-                )
+                response = await self.aclient.chat(**request)
                 content = response['message']['content']
+                result = await self._parse_vote_async(content)
 
-            # Extract JSON from response (handle markdown code blocks)
-            content = content.strip()
-            if content.startswith("```"):
-                # Remove markdown code block
-                content = re.sub(r'^```(?:json)?\n', '', content)
-                content = re.sub(r'\n```$', '', content)
-
-            # Parse JSON response
-            result = json.loads(content)
-
-            # Validate response
-            if "vote" not in result or "statement" not in result:
-                raise ValueError("Response missing required fields")
-
-            if result["vote"].lower() not in self.VALID_VOTES:
-                raise ValueError(f"Invalid vote: {result['vote']}")
-
-            result["vote"] = result["vote"].lower()
+            if cache_key is not None:
+                self.cache.put(cache_key, result)
             return result
 
         except json.JSONDecodeError as e:
             print(f"  ⚠ JSON parse error for {country['name']}: {e}")
             print(f"  Raw response: {content[:200]}...")
-            return {
-                "vote": "abstain",
-                "statement": f"[Error: Unable to parse response]",
-                "error": str(e)
-            }
+            return self._error_result("[Error: Unable to parse response]", str(e))
         except Exception as e:
             print(f"  ⚠ Error querying {country['name']}: {e}")
-            return {
-                "vote": "abstain",
-                "statement": f"[Error: {str(e)}]",
-                "error": str(e)
-            }
+            return self._error_result(f"[Error: {str(e)}]", str(e))
+
+    async def _create_chat_completion(self, request: Dict) -> str:
+        """Stream a chat completion's text, dropping response_format if the endpoint rejects it"""
+        try:
+            return await self._stream_json_object(request)
+        except openai.BadRequestError:
+            if "response_format" not in request:
+                raise
+
+        # Models without structured outputs (e.g. gpt-4) get the prompt-only
+        # JSON instructions for the rest of the run
+        if self.structured_output:
+            self.structured_output = False
+            print("  ⚠ Structured outputs not supported by this model; relying on prompt instructions")
+        request = {key: value for key, value in request.items() if key != "response_format"}
+        return await self._stream_json_object(request)
+
+    async def _stream_json_object(self, request: Dict) -> str:
+        """
+        Stream a chat completion, stopping as soon as the JSON object closes
+
+        Anything a model appends after the vote object (commentary, a repeated
+        answer) is never waited for or billed past the point we disconnect.
+        """
+        stream = await self.aclient.chat.completions.create(**request, stream=True)
+        scanner = _JsonObjectScanner()
+        parts = []
+        try:
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    end = scanner.feed(delta)
+                    if end is not None:
+                        # Drop anything after the object in the same delta
+                        parts.append(delta[:end + 1])
+                        break
+                    parts.append(delta)
+        finally:
+            await stream.close()
+
+        # ...and anything before it
+        text = "".join(parts)
+        start = text.find("{")
+        return text[start:] if start >= 0 else text
+
+    def _parse_vote(self, content: str) -> Dict:
+        """
+        Parse and validate the vote JSON from a model response
+
+        Raises:
+            json.JSONDecodeError: If the response is not valid JSON
+            ValueError: If required fields are missing or the vote is invalid
+        """
+        return self._validate_vote(loads(content))
+
+    async def _parse_vote_async(self, content: str) -> Dict:
+        """
+        _parse_vote, moved to a worker thread for large responses
+
+        Responses tend to finish together, so decoding big ones inline would
+        delay the completion callbacks of requests that are still in flight.
+        Small ones are parsed inline, where a thread hop would cost more.
+        """
+        if len(content) > self.PARSE_OFFLOAD_THRESHOLD:
+            return await asyncio.to_thread(self._parse_vote, content)
+        return self._parse_vote(content)
+
+    def _tool_input(self, message) -> Dict:
+        """Return the validated arguments of the forced record_vote call in a Messages API response"""
+        if message.stop_reason == "max_tokens":
+            # The tool arguments were cut off mid-generation
+            raise ValueError("Response truncated at max_tokens")
+
+        for block in message.content:
+            if block.type == "tool_use":
+                return self._validate_vote(block.input)
+        raise ValueError(f"No tool call in response (stop_reason: {message.stop_reason})")
+
+    def _validate_vote(self, result: Dict) -> Dict:
+        """
+        Check a parsed vote against VOTE_SCHEMA
+
+        Structured outputs already guarantee this for OpenAI and Anthropic;
+        Ollama's JSON mode and endpoints without response_format do not.
+
+        Raises:
+            ValueError: If required fields are missing or the vote is invalid
+        """
+        if "vote" not in result or "statement" not in result:
+            raise ValueError("Response missing required fields")
+
+        vote = result["vote"].lower()
+        if vote not in self.VALID_VOTES:
+            raise ValueError(f"Invalid vote: {result['vote']}")
+
+        result["vote"] = vote
+        return result
+
+    @staticmethod
+    def _vote_record(country: Dict, result: Dict) -> Dict:
+        """Combine a country and its parsed vote into a results entry"""
+        return {
+            "country": country['name'],
+            "country_slug": country['slug'],
+            "vote": result["vote"],
+            "statement": result["statement"],
+            "error": result.get("error")
+        }
+
+    async def query_countries(self, countries: List[Dict], motion: Dict,
+                              concurrency: int = DEFAULT_CONCURRENCY,
+                              on_complete: Optional[Callable[[Dict], None]] = None,
+                              progress_offset: int = 0,
+                              progress_total: Optional[int] = None) -> List[Dict]:
+        """
+        Query many country agents concurrently, bounded by a semaphore
+
+        Every request is created up front and awaited together, so the run takes
+        roughly as long as the slowest requests rather than the sum of them all.
+
+        Args:
+            countries: Countries to query
+            motion: Motion being voted on
+            concurrency: Maximum number of in-flight model requests
+            on_complete: Called with each vote record as soon as it arrives
+            progress_offset: Countries already processed (for progress output)
+            progress_total: Total countries in the run (for progress output)
+
+        Returns:
+            Vote records, in the same order as countries
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        total = progress_total or len(countries)
+        done = progress_offset
+
+        async def query(country: Dict) -> Dict:
+            nonlocal done
+            async with semaphore:
+                result = await self.query_agent(country, motion)
+
+            vote = self._vote_record(country, result)
+            done += 1
+            print(f"[{done}/{total}] {country['name']}: {self.VOTE_EMOJI[vote['vote']]} {vote['vote'].upper()}")
+            if on_complete is not None:
+                on_complete(vote)
+            return vote
+
+        return await asyncio.gather(*(query(country) for country in countries))
+
+    async def _submit_anthropic_batch(self, requests: Dict[str, Dict]) -> Dict[str, Dict]:
+        """Run requests (keyed by country slug) as one Anthropic Message Batch"""
+        batch = await self.aclient.messages.batches.create(requests=[
+            {"custom_id": slug, "params": request}
+            for slug, request in requests.items()
+        ])
+        print(f"✓ Submitted batch {batch.id} ({len(requests)} requests)")
+
+        while batch.processing_status != "ended":
+            await asyncio.sleep(self.BATCH_POLL_INTERVAL)
+            batch = await self.aclient.messages.batches.retrieve(batch.id)
+            counts = batch.request_counts
+            done = counts.succeeded + counts.errored + counts.canceled + counts.expired
+            print(f"  ... {done}/{len(requests)} requests processed")
+
+        results = {}
+        async for entry in await self.aclient.messages.batches.results(batch.id):
+            if entry.result.type != "succeeded":
+                results[entry.custom_id] = self._error_result(
+                    f"[Error: batch request {entry.result.type}]", entry.result.type
+                )
+                continue
+            results[entry.custom_id] = self._parse_batch_content(
+                entry.custom_id, self._tool_input, entry.result.message
+            )
+        return results
+
+    async def _submit_openai_batch(self, requests: Dict[str, Dict]) -> Dict[str, Dict]:
+        """
+        Run requests (keyed by country slug) through the OpenAI Batch API
+
+        Lines rejected because the model does not support response_format are
+        resubmitted once, as a second batch, without it.
+        """
+        lines = [
+            dumps_line({
+                "custom_id": slug,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": request
+            })
+            for slug, request in requests.items()
+        ]
+        input_file = await self.aclient.files.create(
+            file=("batch.jsonl", "\n".join(lines).encode('utf-8')),
+            purpose="batch"
+        )
+        batch = await self.aclient.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        print(f"✓ Submitted batch {batch.id} ({len(requests)} requests)")
+
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            await asyncio.sleep(self.BATCH_POLL_INTERVAL)
+            batch = await self.aclient.batches.retrieve(batch.id)
+            counts = batch.request_counts
+            if counts is not None:
+                print(f"  ... {counts.completed + counts.failed}/{len(requests)} requests processed ({batch.status})")
+
+        results = {}
+        if batch.output_file_id is None:
+            print(f"  ⚠ Batch {batch.id} ended with status {batch.status} and no output")
+            return results
+
+        rejected = {}
+        output = await self.aclient.files.content(batch.output_file_id)
+        for line in output.text.splitlines():
+            if not line.strip():
+                continue
+            entry = loads(line)
+            response = entry.get("response") or {}
+            request = requests.get(entry["custom_id"], {})
+            if response.get("status_code") == 400 and "response_format" in request:
+                rejected[entry["custom_id"]] = {
+                    key: value for key, value in request.items() if key != "response_format"
+                }
+                continue
+            if entry.get("error") or response.get("status_code") != 200:
+                error = str(entry.get("error") or response.get("status_code"))
+                results[entry["custom_id"]] = self._error_result(
+                    f"[Error: batch request failed ({error})]", error
+                )
+                continue
+            results[entry["custom_id"]] = self._parse_batch_content(
+                entry["custom_id"],
+                lambda content: self._parse_vote(self._extract_json_object(content)),
+                response["body"]["choices"][0]["message"]["content"]
+            )
+
+        if rejected:
+            # Models without structured outputs (e.g. gpt-4) reject every line
+            self.structured_output = False
+            print(f"  ⚠ {len(rejected)} requests rejected response_format; resubmitting with prompt instructions only")
+            results.update(await self._submit_openai_batch(rejected))
+        return results
+
+    @staticmethod
+    def _extract_json_object(text: str) -> str:
+        """Return the first JSON object in text, without any prose or code fences around it"""
+        start = text.find("{")
+        if start < 0:
+            return text
+        end = _JsonObjectScanner().feed(text[start:])
+        return text[start:] if end is None else text[start:start + end + 1]
+
+    def _parse_batch_content(self, slug: str, parse: Callable, content) -> Dict:
+        """Parse one batch response with parse, returning an error result if it is unusable"""
+        try:
+            return parse(content)
+        except json.JSONDecodeError as e:
+            print(f"  ⚠ JSON parse error for {slug}: {e}")
+            return self._error_result("[Error: Unable to parse response]", str(e))
+        except Exception as e:
+            print(f"  ⚠ Error parsing vote for {slug}: {e}")
+            return self._error_result(f"[Error: {str(e)}]", str(e))
+
+    async def query_countries_batch(self, countries: List[Dict], motion: Dict) -> List[Dict]:
+        """
+        Query all country agents through the provider's batch API
+
+        Batches are billed at about half the synchronous price and aren't
+        subject to per-minute rate limits, but can take up to 24 hours to
+        finish. Cached votes are reused and not resubmitted.
+
+        Raises:
+            RuntimeError: If every submitted request failed
+
+        Returns:
+            Vote records, in the same order as countries
+        """
+        if self.provider != "cloud":
+            raise ValueError("The batch API is only available for cloud providers")
+
+        results = {}
+        requests = {}
+        cache_keys = {}
+        for country in countries:
+            request = self._build_request(country, motion)
+            if self.cache is not None:
+                cache_keys[country['slug']] = self._cache_key(request)
+                cached = self.cache.get(cache_keys[country['slug']])
+                if cached is not None:
+                    results[country['slug']] = cached
+                    continue
+            requests[country['slug']] = request
+        if self.cache is not None:
+            print(f"💾 Reused {len(results)} cached votes\n")
+
+        if requests:
+            if self.use_anthropic:
+                fresh = await self._submit_anthropic_batch(requests)
+            else:
+                fresh = await self._submit_openai_batch(requests)
+            print()
+            if all("error" in fresh.get(slug, {"error": None}) for slug in requests):
+                raise RuntimeError(f"All {len(requests)} batch requests failed; no results saved")
+            for slug, result in fresh.items():
+                if self.cache is not None and "error" not in result:
+                    self.cache.put(cache_keys[slug], result)
+            results.update(fresh)
+
+        votes = []
+        for country in countries:
+            result = results.get(country['slug']) or self._error_result(
+                "[Error: No batch result returned]", "missing_result"
+            )
+            vote = self._vote_record(country, result)
+            print(f"[{len(votes) + 1}/{len(countries)}] {country['name']}: {self.VOTE_EMOJI[vote['vote']]} {vote['vote'].upper()}")
+            votes.append(vote)
+        return votes
+
+    def _checkpoint_path(self, motion_id: str) -> Path:
+        """Path of the append-only NDJSON file holding votes completed so far"""
+        return self.results_dir / f"{motion_id}_partial.ndjson"
+
+    def _summary_path(self, motion_id: str) -> Path:
+        """Path of the progress summary written alongside the checkpoint"""
+        return self.results_dir / f"{motion_id}_partial.summary.json"
+
+    def _checkpoint_header(self, motion: Dict) -> Dict:
+        """First line of a checkpoint: identifies the provider, model and motion text it was made with"""
+        return {"checkpoint": ResponseCache.make_key({
+            "provider": self.provider,
+            "model": self.model,
+            "motion": self.build_motion_prompt(motion)
+        })}
+
+    @staticmethod
+    def _load_checkpoint(checkpoint_path: Path, header: Dict) -> Optional[Dict[str, Dict]]:
+        """
+        Read votes completed so far from a checkpoint file, keyed by country slug
+
+        Votes recorded with an error are left out, so a resumed run retries them.
+
+        Returns:
+            The completed votes, or None if there is no checkpoint or its header
+            does not match (it was made with another provider, model or motion text)
+        """
+        if not checkpoint_path.exists():
+            return None
+
+        completed = {}
+        with open(checkpoint_path, 'r', encoding='utf-8') as f:
+            try:
+                if loads(f.readline()) != header:
+                    return None
+            except json.JSONDecodeError:
+                return None
+            for line in f:
+                try:
+                    vote = loads(line)
+                except json.JSONDecodeError:
+                    # Last line was cut off by an interruption
+                    continue
+                if not vote.get("error"):
+                    completed[vote['country_slug']] = vote
+        return completed
+
+    @staticmethod
+    def _sync_checkpoint(fd: int, summary: Dict, summary_path: Path):
+        """Flush the checkpoint to disk and record progress (runs on a worker thread)"""
+        os.fsync(fd)
+        # Replace the summary atomically, so it is never half-written
+        tmp_path = summary_path.with_suffix(".tmp")
+        dump_json(summary, tmp_path)
+        os.replace(tmp_path, summary_path)
+
+    async def query_countries_checkpointed(self, countries: List[Dict], motion: Dict,
+                                           concurrency: int, checkpoint_every: int) -> List[Dict]:
+        """
+        Query countries concurrently, checkpointing votes as they arrive
+
+        Every vote is appended to an NDJSON checkpoint by a single saver task;
+        every checkpoint_every votes the checkpoint is synced and a small
+        progress summary is rewritten, off the event loop, so queries never
+        wait on the disk. Countries already answered in the checkpoint from
+        an interrupted run are skipped; those that failed are asked again.
+        A checkpoint made with a different provider, model or motion text is
+        discarded rather than resumed.
+
+        Returns:
+            Vote records, in the same order as countries
+        """
+        self.results_dir.mkdir(parents=True, exist_ok=True)
+        checkpoint_path = self._checkpoint_path(motion['id'])
+        summary_path = self._summary_path(motion['id'])
+        header = self._checkpoint_header(motion)
+        completed = self._load_checkpoint(checkpoint_path, header)
+        if completed is None:
+            if checkpoint_path.exists():
+                print("⚠ Discarding checkpoint from a different provider, model or motion text\n")
+            completed = {}
+            with open(checkpoint_path, 'w', encoding='utf-8') as f:
+                f.write(dumps_line(header) + "\n")
+        remaining = [country for country in countries if country['slug'] not in completed]
+        if len(remaining) < len(countries):
+            print(f"↻ Resuming: {len(countries) - len(remaining)} countries already processed\n")
 
-    def run_motion(self, motion_id: str, sample_size: Optional[int] = None) -> Dict:
+        vote_counts = {"yes": 0, "no": 0, "abstain": 0}
+        for vote in completed.values():
+            vote_counts[vote["vote"]] += 1
+
+        queue: asyncio.Queue = asyncio.Queue()
+
+        with open(checkpoint_path, 'a', encoding='utf-8') as checkpoint:
+            # Start on a fresh line if the last run was cut off mid-write
+            if checkpoint.tell():
+                with open(checkpoint_path, 'rb') as f:
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b"\n":
+                        checkpoint.write("\n")
+
+            async def save_votes():
+                unsynced = 0
+                finished = False
+                while not finished:
+                    batch = [await queue.get()]
+                    while not queue.empty():
+                        batch.append(queue.get_nowait())
+                    if batch[-1] is None:
+                        finished = True
+                        batch.pop()
+
+                    checkpoint.write("".join(dumps_line(vote) + "\n" for vote in batch))
+                    checkpoint.flush()
+                    for vote in batch:
+                        completed[vote['country_slug']] = vote
+                        vote_counts[vote["vote"]] += 1
+
+                    unsynced += len(batch)
+                    if unsynced >= checkpoint_every or (finished and unsynced):
+                        unsynced = 0
+                        await asyncio.to_thread(self._sync_checkpoint, checkpoint.fileno(), {
+                            "motion_id": motion['id'],
+                            "timestamp": _utc_timestamp(),
+                            "provider": self.provider,
+                            "model": self.model,
+                            "total_votes": len(completed),
+                            "vote_summary": vote_counts.copy(),
+                            "status": f"In progress: {len(completed)}/{len(countries)} countries processed"
+                        }, summary_path)
+                        print(f"💾 Saved intermediate results: {len(completed)}/{len(countries)} countries")
+
+            saver = asyncio.create_task(save_votes())
+            try:
+                await self.query_countries(
+                    remaining, motion, concurrency,
+                    on_complete=queue.put_nowait,
+                    progress_offset=len(countries) - len(remaining),
+                    progress_total=len(countries)
+                )
+            finally:
+                # Flush whatever has arrived, even if the run was interrupted
+                queue.put_nowait(None)
+                await saver
+
+        print(f"   File: {checkpoint_path}")
+        return [completed[country['slug']] for country in countries]
+
+    async def run_motion(self, motion_id: str, sample_size: Optional[int] = None,
+                         concurrency: int = DEFAULT_CONCURRENCY,
+                         use_batch_api: bool = False,
+                         checkpoint_every: Optional[int] = None) -> Dict:
         """
         Run a motion through all country agents
 
         Args:
             motion_id: ID of the motion to run
             sample_size: If set, only query this many countries (for testing)
+            concurrency: Maximum number of in-flight model requests
+            use_batch_api: Submit all countries through the provider's batch API
+                instead of concurrent requests (cheaper, but can take much longer)
+            checkpoint_every: If set, checkpoint votes as they arrive (synced
+                every N votes) and resume from an interrupted run's checkpoint;
+                otherwise results are only saved at the end
 
         Returns:
             Dict containing all votes and metadata
@@ -275,33 +1103,23 @@ Your response must be valid JSON in this exact format:
         else:
             print(f"📊 Querying {len(countries)} countries\n")
 
-        # Query each country
-        votes = []
-        vote_counts = {"yes": 0, "no": 0, "abstain": 0}
-
-        for i, country in enumerate(countries, 1):
-            print(f"[{i}/{len(countries)}] Querying {country['name']}...", end=" ", flush=True)
-
-            result = self.query_agent(country, motion)
-
-            vote_counts[result["vote"]] += 1
-            votes.append({
-                "country": country['name'],
-                "country_slug": country['slug'],
-                "vote": result["vote"],
-                "statement": result["statement"],
-                "error": result.get("error")
-            })
+        # Query every country concurrently, or as one batch job
+        if use_batch_api:
+            votes = await self.query_countries_batch(countries, motion)
+        elif checkpoint_every:
+            votes = await self.query_countries_checkpointed(countries, motion, concurrency, checkpoint_every)
+        else:
+            votes = await self.query_countries(countries, motion, concurrency)
 
-            # Print vote result
-            vote_emoji = {"yes": "✅", "no": "❌", "abstain": "⚪"}
-            print(f"{vote_emoji[result['vote']]} {result['vote'].upper()}")
+        vote_counts = {"yes": 0, "no": 0, "abstain": 0}
+        for vote in votes:
+            vote_counts[vote["vote"]] += 1
 
         # Compile results
         results = {
             "motion_id": motion_id,
             "motion_path": motion['path'],
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": _utc_timestamp(),
             "provider": self.provider,
             "model": self.model,
             "total_votes": len(countries),
@@ -324,24 +1142,26 @@ Your response must be valid JSON in this exact format:
         # Create results directory if it doesn't exist
         self.results_dir.mkdir(parents=True, exist_ok=True)
 
-        # Generate filename with timestamp
-        timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+        # Generate filename from the run's own timestamp, so the name and the field agree
+        timestamp = datetime.fromisoformat(results['timestamp']).strftime("%Y%m%d_%H%M%S")
         filename = f"{results['motion_id']}_{timestamp}.json"
         filepath = self.results_dir / filename
 
         # Save results
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(results, f, indent=2, ensure_ascii=False)
+        dump_json(results, filepath)
 
         print(f"✓ Results saved to: {filepath}")
 
-        # Also create/update a "latest" symlink or copy
+        # Also point the "latest" version at it
         latest_filepath = self.results_dir / f"{results['motion_id']}_latest.json"
-        with open(latest_filepath, 'w', encoding='utf-8') as f:
-            json.dump(results, f, indent=2, ensure_ascii=False)
+        link_latest(filepath, latest_filepath)
 
         print(f"✓ Latest results: {latest_filepath}")
 
+        # The run is complete, so any resume checkpoint is no longer needed
+        self._checkpoint_path(results['motion_id']).unlink(missing_ok=True)
+        self._summary_path(results['motion_id']).unlink(missing_ok=True)
+
 
 def main():
     parser = argparse.ArgumentParser(
@@ -360,6 +1180,18 @@ Examples:
 
   # Use specific model
   python scripts/run_motion.py 01_gaza_ceasefire_resolution --model gpt-4-turbo
+
+  # Limit in-flight requests for a low rate-limit tier
+  python scripts/run_motion.py 01_gaza_ceasefire_resolution --concurrency 4
+
+  # Checkpoint every 20 votes; re-run the same command to resume if interrupted
+  python scripts/run_motion.py 01_gaza_ceasefire_resolution --checkpoint-every 20
+
+  # Submit as one batch job (~50% cheaper, can take up to 24 hours)
+  python scripts/run_motion.py 01_gaza_ceasefire_resolution --batch-api
+
+  # Query every country again instead of reusing cached responses
+  python scripts/run_motion.py 01_gaza_ceasefire_resolution --no-cache
         """
     )
 
@@ -386,12 +1218,71 @@ Examples:
         help="Only query N countries (for testing)"
     )
 
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=MotionRunner.DEFAULT_CONCURRENCY,
+        help=f"Maximum concurrent model requests (default: {MotionRunner.DEFAULT_CONCURRENCY})"
+    )
+
+    parser.add_argument(
+        "--checkpoint-every",
+        type=int,
+        metavar="N",
+        help="Checkpoint votes as they arrive, syncing every N votes, and resume interrupted runs"
+    )
+
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        dest="checkpoint_every",
+        help=argparse.SUPPRESS  # Deprecated alias of --checkpoint-every (old run_motion_chunked.py)
+    )
+
+    parser.add_argument(
+        "--batch-api",
+        action="store_true",
+        help="Submit all countries through the OpenAI/Anthropic batch API (cloud only)"
+    )
+
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore cached responses from previous runs and don't cache new ones"
+    )
+
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        help="Directory for cached responses (default: .cache/motions)"
+    )
+
     args = parser.parse_args()
+    if args.batch_api and args.provider != "cloud":
+        parser.error("--batch-api requires --provider cloud")
+    if args.batch_api and args.checkpoint_every:
+        parser.error("--batch-api and --checkpoint-every cannot be combined")
 
     # Run simulation
     try:
-        runner = MotionRunner(provider=args.provider, model=args.model)
-        results = runner.run_motion(args.motion_id, sample_size=args.sample)
+        runner = MotionRunner(
+            provider=args.provider,
+            model=args.model,
+            use_cache=not args.no_cache,
+            cache_dir=args.cache_dir
+        )
+
+        async def run() -> Dict:
+            async with runner:
+                return await runner.run_motion(
+                    args.motion_id,
+                    sample_size=args.sample,
+                    concurrency=args.concurrency,
+                    use_batch_api=args.batch_api,
+                    checkpoint_every=args.checkpoint_every
+                )
+
+        results = uvloop.run(run()) if uvloop is not None else asyncio.run(run())
         runner.save_results(results)
 
         print("\n✓ Motion simulation complete!")
@@ -401,6 +1292,8 @@ Examples:
         sys.exit(1)
     except KeyboardInterrupt:
         print("\n\n⚠ Simulation interrupted by user")
+        if args.checkpoint_every:
+            print("💾 Completed votes are checkpointed; re-run the same command to resume")
         sys.exit(130)
     except Exception as e:
         print(f"\n❌ Unexpected error: {e}", file=sys.stderr)
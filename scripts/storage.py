@@ -0,0 +1,103 @@
+"""
+Shared storage helpers for the simulation and analysis scripts
+
+Provides an exact-match on-disk cache for LLM responses so re-runs of the
+same prompts (iteration, debugging, resuming after a crash) don't re-pay for
+every request, plus JSON read/write helpers that use orjson when it is
+installed and fall back to the standard library otherwise, and a helper for
+pointing the "_latest" result files at the newest timestamped output.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(data):
+    """Parse a JSON document from str or bytes"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_line(obj: Any) -> str:
+    """Serialize obj as a single compact JSON line (no trailing newline)"""
+    if orjson is not None:
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj, ensure_ascii=False)
+
+
+def load_json(path: Path) -> Any:
+    """Read and parse a JSON file"""
+    with open(path, 'rb') as f:
+        return loads(f.read())
+
+
+def dump_json(obj: Any, path: Path):
+    """Write obj to path as indented UTF-8 JSON"""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        return
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(obj, f, indent=2, ensure_ascii=False)
+
+
+def link_latest(target: Path, latest: Path):
+    """
+    Point latest at target without re-serializing the results
+
+    Creates a relative symlink in the same directory; where symlinks aren't
+    permitted (e.g. Windows without developer mode) the file is copied instead.
+    """
+    latest.unlink(missing_ok=True)
+    try:
+        latest.symlink_to(target.name)
+    except OSError:
+        shutil.copyfile(target, latest)
+
+
+class ResponseCache:
+    """Exact-match LLM response cache stored as one JSON file per key"""
+
+    def __init__(self, cache_dir: Path):
+        """
+        Initialize the cache
+
+        Args:
+            cache_dir: Directory holding the cached responses (created if missing)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def make_key(payload: Any) -> str:
+        """Hash a JSON-serializable request payload into a cache key"""
+        canonical = json.dumps(payload, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Return the cached response for key, or None on a miss"""
+        try:
+            return load_json(self._path(key))
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def put(self, key: str, value: Dict):
+        """Store a response under key (atomic, so readers never see partial files)"""
+        path = self._path(key)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(dumps_line(value))
+        os.replace(tmp_path, path)
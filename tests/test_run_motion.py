@@ -0,0 +1,141 @@
+"""Tests for the motion runner's streamed vote parsing and checkpoints"""
+
+import asyncio
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from run_motion import MotionRunner, _JsonObjectScanner
+
+
+class FakeStream:
+    """Async iterator standing in for an OpenAI chat completion stream"""
+
+    def __init__(self, deltas):
+        self.deltas = deltas
+        self.closed = False
+
+    async def _chunks(self):
+        for delta in self.deltas:
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=delta))])
+
+    def __aiter__(self):
+        return self._chunks()
+
+    async def close(self):
+        self.closed = True
+
+
+def stream_vote(deltas):
+    """Run MotionRunner._stream_json_object over deltas and parse the result"""
+    stream = FakeStream(deltas)
+
+    async def create(**request):
+        return stream
+
+    runner = MotionRunner.__new__(MotionRunner)
+    runner.aclient = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    content = asyncio.run(runner._stream_json_object({}))
+    return runner._parse_vote(content), stream
+
+
+class JsonObjectScannerTest(unittest.TestCase):
+
+    def test_returns_index_of_closing_brace(self):
+        text = '{"vote": "yes"} trailing'
+        self.assertEqual(_JsonObjectScanner().feed(text), text.index("}"))
+
+    def test_ignores_braces_inside_strings(self):
+        scanner = _JsonObjectScanner()
+        self.assertIsNone(scanner.feed('{"statement": "a } \\" {'))
+        self.assertEqual(scanner.feed(' b"}'), 3)
+
+    def test_skips_text_before_object(self):
+        scanner = _JsonObjectScanner()
+        self.assertIsNone(scanner.feed('Here is my "vote": '))
+        self.assertEqual(scanner.feed('{}'), 1)
+
+
+class StreamJsonObjectTest(unittest.TestCase):
+
+    def test_closing_brace_and_trailing_text_in_one_chunk(self):
+        vote, stream = stream_vote(['{"vote": "Yes", ', '"statement": "ok', '."} I hope this helps!', ' More.'])
+        self.assertEqual(vote, {"vote": "yes", "statement": "ok."})
+        self.assertTrue(stream.closed)
+
+    def test_text_before_object_is_dropped(self):
+        vote, _ = stream_vote(['Sure! ```json\n{"vote": "no",', ' "statement": "x"}\n```'])
+        self.assertEqual(vote, {"vote": "no", "statement": "x"})
+
+    def test_small_deltas_with_commentary(self):
+        text = '{"vote": "abstain", "statement": "We {cannot} support \\"this\\"."} Thanks.'
+        deltas = [text[i:i + 7] for i in range(0, len(text), 7)]
+        vote, _ = stream_vote(deltas)
+        self.assertEqual(vote["vote"], "abstain")
+        self.assertEqual(vote["statement"], 'We {cannot} support "this".')
+
+
+class ExtractJsonObjectTest(unittest.TestCase):
+    def test_fenced_object_with_prose(self):
+        content = 'Here is my vote:\n```json\n{"vote": "no", "statement": "See {annex}."}\n```\nThanks {'
+        self.assertEqual(
+            MotionRunner._extract_json_object(content),
+            '{"vote": "no", "statement": "See {annex}."}'
+        )
+
+    def test_text_without_object_is_unchanged(self):
+        self.assertEqual(MotionRunner._extract_json_object("I abstain."), "I abstain.")
+
+
+class CacheKeyTest(unittest.TestCase):
+    def test_structured_output_fallback_keeps_key(self):
+        runner = MotionRunner.__new__(MotionRunner)
+        runner.provider = "openai"
+        request = {"model": "gpt-4", "messages": [{"role": "user", "content": "Vote"}]}
+        structured = dict(request, response_format={"type": "json_schema"})
+        self.assertEqual(runner._cache_key(structured), runner._cache_key(request))
+
+
+class LoadCheckpointTest(unittest.TestCase):
+    HEADER = '{"checkpoint": "abc"}'
+
+    def load(self, lines, header=HEADER):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "motion_partial.ndjson"
+            path.write_text("".join(line + "\n" for line in [header, *lines]), encoding="utf-8")
+            return MotionRunner._load_checkpoint(path, {"checkpoint": "abc"})
+
+    def test_mismatched_header_is_discarded(self):
+        self.assertIsNone(self.load(['{"country_slug": "france", "vote": "yes"}'], '{"checkpoint": "old"}'))
+
+    def test_missing_header_is_discarded(self):
+        self.assertIsNone(self.load([], '{"country_slug": "france", "vote": "yes"}'))
+
+    def test_error_votes_are_retried(self):
+        completed = self.load([
+            '{"country_slug": "france", "vote": "yes"}',
+            '{"country_slug": "japan", "vote": "abstain", "error": "timeout"}',
+        ])
+        self.assertEqual(list(completed), ["france"])
+
+    def test_later_success_replaces_error(self):
+        completed = self.load([
+            '{"country_slug": "japan", "vote": "abstain", "error": "timeout"}',
+            '{"country_slug": "japan", "vote": "no"}',
+        ])
+        self.assertEqual(completed["japan"]["vote"], "no")
+
+    def test_truncated_last_line_is_ignored(self):
+        completed = self.load([
+            '{"country_slug": "france", "vote": "yes"}',
+            '{"country_slug": "jap',
+        ])
+        self.assertEqual(list(completed), ["france"])
+
+
+if __name__ == "__main__":
+    unittest.main()